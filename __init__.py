@@ -1,21 +1,51 @@
 """The SesameOS 3 integration."""
 
 from __future__ import annotations
+from homeassistant.config_entries import ConfigEntryState
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
+from .const import DOMAIN
 from .devices import Sesame5
+from .discovery import async_release_discovery_index
 from .models import SesameConfigEntry
+from .services import async_setup_services
+from .storage import SesameStore
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the SesameOS 3 services."""
+    async_setup_services(hass)
+    return True
 
 async def async_setup_entry(hass: HomeAssistant, entry: SesameConfigEntry) -> bool:
     """Set up SesameOS 3 from a config entry."""
     entry.runtime_data = Sesame5(hass, entry)
     await entry.runtime_data.initialize()
-    await hass.config_entries.async_forward_entry_setups(entry, entry.runtime_data.offers)
+    entry.runtime_data.build_entities()
+    await hass.config_entries.async_forward_entry_setups(entry, entry.runtime_data.platforms)
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
     return True
 
+async def _async_update_listener(hass: HomeAssistant, entry: SesameConfigEntry) -> None:
+    """Reload the entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
 async def async_unload_entry(hass: HomeAssistant, entry: SesameConfigEntry) -> bool:
     """Unload a config entry."""
-    if (unload_ok := await hass.config_entries.async_unload_platforms(entry, entry.runtime_data.offers)):
+    if (unload_ok := await hass.config_entries.async_unload_platforms(entry, entry.runtime_data.platforms)):
         await entry.runtime_data.disconnect()
+        if not any(
+            other.state is ConfigEntryState.LOADED
+            for other in hass.config_entries.async_entries(DOMAIN)
+            if other.entry_id != entry.entry_id
+        ):
+            async_release_discovery_index(hass)
     return unload_ok
+
+async def async_remove_entry(hass: HomeAssistant, entry: SesameConfigEntry) -> None:
+    """Remove persisted state of a deleted config entry."""
+    await SesameStore(hass, entry.entry_id).async_remove()
@@ -0,0 +1,54 @@
+"""Parsing of CANDY HOUSE BLE advertisements."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+from homeassistant.components.bluetooth import BluetoothServiceInfoBleak
+
+from .const import (
+    ADV_STATUS_CRITICAL,
+    ADV_STATUS_LOCKED,
+    ADV_STATUS_REGISTERED,
+    MANUFACTURER_ID,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class SesameAdvertisement:
+    address: str
+    uuid: bytes
+    product_type: int
+    status: int
+    rssi: int
+    source: str
+    connectable: bool
+
+    @property
+    def registered(self) -> bool:
+        return bool(self.status & ADV_STATUS_REGISTERED)
+
+    @property
+    def locked(self) -> bool:
+        return bool(self.status & ADV_STATUS_LOCKED)
+
+    @property
+    def critical(self) -> bool:
+        return bool(self.status & ADV_STATUS_CRITICAL)
+
+
+def parse_advertisement(service_info: BluetoothServiceInfoBleak) -> Optional[SesameAdvertisement]:
+    """Extract Sesame device information from CANDY HOUSE manufacturer data (0x055A)."""
+    data = service_info.manufacturer_data.get(MANUFACTURER_ID)
+    if not data or len(data) < 19:
+        return None
+    return SesameAdvertisement(
+        address=service_info.address,
+        uuid=bytes(data[3:19]),
+        product_type=int.from_bytes(data[0:2], "little"),
+        status=data[2],
+        rssi=service_info.rssi,
+        source=service_info.source,
+        connectable=service_info.connectable,
+    )
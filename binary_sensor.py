@@ -4,7 +4,7 @@ from .models import SesameConfigEntry
 
 
 async def async_setup_entry(hass, entry: SesameConfigEntry, async_add_entities):
-    if Platform.BINARY_SENSOR in entry.runtime_data.offers:
+    if Platform.BINARY_SENSOR in entry.runtime_data.platforms:
         async_add_entities(
             entry.runtime_data.get_entities(Platform.BINARY_SENSOR),
         )
\ No newline at end of file
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import logging
 from typing import Any
@@ -11,13 +12,40 @@ import voluptuous as vol
 
 from sesameos3client import SesameClient
 
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from homeassistant.config_entries import (
+    SOURCE_IMPORT,
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
 from homeassistant.const import CONF_NAME, CONF_MAC
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.data_entry_flow import FlowResultType
 from homeassistant.helpers import selector
-from homeassistant.components import bluetooth
+from homeassistant.helpers.device_registry import format_mac
+from homeassistant.components.bluetooth import BluetoothServiceInfoBleak
 
-from .const import DOMAIN
+from .advertisement import SesameAdvertisement, parse_advertisement
+from .const import (
+    CONF_IDLE_TIMEOUT,
+    CONF_PASSIVE,
+    CONF_POSITION_MIN_DELTA,
+    CONF_POSITION_MIN_INTERVAL,
+    CONF_PREWARM_RSSI,
+    CONF_WATCHDOG_INTERVAL,
+    CONF_WATCHDOG_MISSES,
+    DEFAULT_POSITION_MIN_DELTA,
+    DEFAULT_POSITION_MIN_INTERVAL,
+    DEFAULT_PREWARM_RSSI,
+    DEFAULT_WATCHDOG_INTERVAL,
+    DEFAULT_WATCHDOG_MISSES,
+    DOMAIN,
+    PRODUCT_SESAME_5,
+)
+from .discovery import async_get_discovery_index
+from .handoff import async_discard_handoff, async_store_handoff
+from .models import ConnectionScheduler, get_scheduler
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,6 +63,12 @@ STEP_QR_DATA_SCHEMA = vol.Schema(
     }
 )
 
+STEP_BULK_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required("qr_codes"): selector.TextSelector(selector.TextSelectorConfig(multiline=True)),
+    }
+)
+
 def parse_qr_code(qr_code: str) -> dict[str, Any]:
     """Parse Sesame QR code and extract device information."""
     if not qr_code.startswith("ssm://UI?"):
@@ -77,55 +111,35 @@ def parse_qr_code(qr_code: str) -> dict[str, Any]:
     return result
 
 
-def _matches_target_uuid(service_info, target_uuid: str) -> bool:
-    """Check if service info matches target UUID by extracting Sesame device information."""
-    if not service_info.manufacturer_data:
-        return False
-        
-    # Look for CANDY HOUSE manufacturer data (0x055A)
-    candy_house_data = service_info.manufacturer_data.get(0x055A)
-    if not candy_house_data or len(candy_house_data) < 19:
-        return False
-        
-    # Extract UUID from manufacturer data (bytes 3-18, after product type + status)
-    device_uuid = candy_house_data[3:19].hex()
-    return device_uuid.lower() == target_uuid.lower()
-
-
 async def find_device_by_uuid(hass: HomeAssistant, target_uuid: str) -> str | None:
-    """Find MAC address of Sesame device by UUID from Bluetooth scan."""
+    """Find MAC address of Sesame device by UUID from the discovery index."""
     try:
-        # Get all discovered service info with CANDY HOUSE manufacturer ID
-        service_infos = bluetooth.async_discovered_service_info(hass, connectable=True)
-        
-        for service_info in service_infos:
-            if _matches_target_uuid(service_info, target_uuid):
-                return service_info.address
-                
-        # If not found in current discoveries, try to wait for new advertisements
+        index = async_get_discovery_index(hass)
+        uuid = bytes.fromhex(target_uuid)
+        if (advertisement := index.lookup(uuid)) is not None:
+            return advertisement.address
+
+        # If not seen yet, wait for its advertisement for up to 10 seconds
         _LOGGER.debug("Device not found in current discoveries, waiting for advertisements...")
-        
-        # Wait for matching advertisement for up to 10 seconds
-        service_info = await bluetooth.async_process_advertisements(
-            hass,
-            lambda si: _matches_target_uuid(si, target_uuid),
-            {"connectable": True},
-            bluetooth.BluetoothScanningMode.ACTIVE,
-            10
-        )
-        
-        if service_info:
-            return service_info.address
-                    
+        if (advertisement := await index.async_wait(uuid, 10)) is not None:
+            return advertisement.address
+
     except Exception as e:
         _LOGGER.error("Error scanning for Bluetooth devices: %s", e)
-        
+
     return None
 
+async def find_devices_by_uuid(hass: HomeAssistant, target_uuids: list[str]) -> dict[str, SesameAdvertisement]:
+    """Find advertisements of several Sesame devices, waiting up to 10 seconds for all of them at once."""
+    index = async_get_discovery_index(hass)
+    results = await asyncio.gather(*(index.async_wait(bytes.fromhex(uuid), 10) for uuid in target_uuids))
+    return {uuid: advertisement for uuid, advertisement in zip(target_uuids, results) if advertisement is not None}
+
 async def connection_trial(hass: HomeAssistant, data: dict[str, Any]) -> None:
     client = SesameClient(data[CONF_MAC], base64.b64decode(data["device_secret"]))
     await client.connect()
-    await client.disconnect()
+    # Keep the authenticated connection for the entry that is about to be created
+    async_store_handoff(hass, data[CONF_MAC], data["device_secret"], client)
 
 
 class SesameConfigFlow(ConfigFlow, domain=DOMAIN):
@@ -137,6 +151,13 @@ class SesameConfigFlow(ConfigFlow, domain=DOMAIN):
         """Initialize the config flow."""
         super().__init__()
         self._qr_data: dict[str, Any] = {}
+        self._discovered: SesameAdvertisement | None = None
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> SesameOptionsFlow:
+        """Get the options flow for this handler."""
+        return SesameOptionsFlow()
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -145,13 +166,15 @@ class SesameConfigFlow(ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             if user_input["setup_method"] == "qr_code":
                 return await self.async_step_qr_code()
+            elif user_input["setup_method"] == "bulk":
+                return await self.async_step_bulk()
             else:
                 return await self.async_step_device_info()
 
         setup_schema = vol.Schema({
             vol.Required("setup_method", default="qr_code"): selector.SelectSelector(
                 selector.SelectSelectorConfig(
-                    options=["qr_code", "manual"],
+                    options=["qr_code", "bulk", "manual"],
                     translation_key="setup_method",
                 )
             )
@@ -161,6 +184,52 @@ class SesameConfigFlow(ConfigFlow, domain=DOMAIN):
             step_id="user", data_schema=setup_schema
         )
 
+    async def async_step_bluetooth(
+        self, discovery_info: BluetoothServiceInfoBleak
+    ) -> ConfigFlowResult:
+        """Handle a Sesame found by Bluetooth discovery."""
+        # The manifest matches every CANDY HOUSE product
+        if (advertisement := parse_advertisement(discovery_info)) is None \
+                or advertisement.product_type != PRODUCT_SESAME_5:
+            return self.async_abort(reason="not_supported")
+        await self.async_set_unique_id(format_mac(discovery_info.address))
+        self._abort_if_unique_id_configured()
+        self._async_abort_entries_match({CONF_MAC: discovery_info.address})
+        async_get_discovery_index(self.hass).update(advertisement)
+        self._discovered = advertisement
+        self.context["title_placeholders"] = {"name": discovery_info.name or discovery_info.address}
+        return await self.async_step_bluetooth_confirm()
+
+    async def async_step_bluetooth_confirm(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Ask for the QR code of a discovered device, which holds its secret."""
+        errors: dict[str, str] = {}
+        assert self._discovered is not None
+        if user_input is not None:
+            try:
+                qr_data = parse_qr_code(user_input["qr_code"])
+            except ValueError as e:
+                errors["base"] = "invalid_qr_code"
+                _LOGGER.error("Invalid QR code: %s", e)
+            else:
+                if qr_data["device_uuid"] != self._discovered.uuid.hex():
+                    errors["base"] = "qr_code_mismatch"
+                else:
+                    return await self.async_step_device_info({
+                        "_qr_prefill": True,
+                        CONF_NAME: qr_data["device_name"],
+                        "device_secret": qr_data["device_secret"],
+                        CONF_MAC: self._discovered.address,
+                    })
+
+        return self.async_show_form(
+            step_id="bluetooth_confirm",
+            data_schema=STEP_QR_DATA_SCHEMA,
+            errors=errors,
+            description_placeholders={"address": self._discovered.address},
+        )
+
     async def async_step_qr_code(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -204,6 +273,73 @@ class SesameConfigFlow(ConfigFlow, domain=DOMAIN):
             step_id="qr_code", data_schema=STEP_QR_DATA_SCHEMA, errors=errors
         )
 
+    async def async_step_bulk(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Add every lock of a list of QR codes, one per line, and report the outcome of each."""
+        if user_input is None:
+            return self.async_show_form(step_id="bulk", data_schema=STEP_BULK_DATA_SCHEMA)
+
+        report: list[str] = []
+        pending: dict[str, dict[str, Any]] = {}
+        configured = {format_mac(entry.data[CONF_MAC]) for entry in self._async_current_entries(include_ignore=False)}
+        for line in user_input["qr_codes"].splitlines():
+            if not (line := line.strip()):
+                continue
+            try:
+                qr_data = parse_qr_code(line)
+            except ValueError as e:
+                report.append(f"- {line[:40]}: invalid QR code ({e})")
+                continue
+            pending.setdefault(qr_data["device_uuid"], qr_data)
+
+        found = await find_devices_by_uuid(self.hass, list(pending))
+        scheduler = get_scheduler(self.hass)
+
+        async def validate(uuid: str, qr_data: dict[str, Any]) -> str:
+            name = qr_data["device_name"]
+            if (advertisement := found.get(uuid)) is None:
+                return "not found"
+            if format_mac(advertisement.address) in configured:
+                return "already configured"
+            data = {CONF_NAME: name, CONF_MAC: advertisement.address, "device_secret": qr_data["device_secret"]}
+            try:
+                async with scheduler.slot(advertisement.source, ConnectionScheduler.PRIORITY_USER):
+                    await connection_trial(self.hass, data)
+            except Exception as e:
+                _LOGGER.debug("Error connecting to %s: %s", name, e)
+                return "cannot connect"
+            try:
+                result = await self.hass.config_entries.flow.async_init(
+                    DOMAIN, context={"source": SOURCE_IMPORT}, data=data
+                )
+            except Exception:
+                _LOGGER.exception("Error adding %s", name)
+                result = {"type": FlowResultType.ABORT, "reason": "failed"}
+            if result["type"] is FlowResultType.CREATE_ENTRY:
+                return "added"
+            # The trial's connection was handed off for an entry that was never created
+            async_discard_handoff(self.hass, advertisement.address)
+            return result.get("reason", "failed")
+
+        # Per-source connection slots bound how many trials run at once; validate reports its own errors
+        outcomes = await asyncio.gather(*(validate(uuid, qr_data) for uuid, qr_data in pending.items()))
+        for (uuid, qr_data), outcome in zip(pending.items(), outcomes):
+            report.append(f"- {qr_data['device_name']} ({uuid[:8]}): {outcome}")
+        return self.async_abort(
+            reason="bulk_complete",
+            description_placeholders={"report": "\n".join(report) or "-"},
+        )
+
+    async def async_step_import(self, import_data: dict[str, Any]) -> ConfigFlowResult:
+        """Create an entry for a lock already validated by the bulk step."""
+        # A discovery flow for the same lock may be open; this one takes over from it
+        await self.async_set_unique_id(format_mac(import_data[CONF_MAC]), raise_on_progress=False)
+        self._abort_if_unique_id_configured()
+        data = dict(import_data)
+        title = data.pop(CONF_NAME)
+        return self.async_create_entry(title=title, data=data)
+
     async def async_step_device_discovery(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -264,6 +400,9 @@ class SesameConfigFlow(ConfigFlow, domain=DOMAIN):
         qr_prefill = user_input and user_input.pop("_qr_prefill", False)
         
         if user_input is not None and not qr_prefill:
+            # Check before connecting so an aborted flow leaves no connection behind
+            await self.async_set_unique_id(format_mac(user_input[CONF_MAC]), raise_on_progress=False)
+            self._abort_if_unique_id_configured()
             try:
                 await connection_trial(self.hass, user_input)
             except:
@@ -292,4 +431,45 @@ class SesameConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="device_info", data_schema=data_schema, errors=errors
-        )
\ No newline at end of file
+        )
+
+
+class SesameOptionsFlow(OptionsFlow):
+    """Handle per-entry connection options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        options_schema = vol.Schema({
+            vol.Required(
+                CONF_PASSIVE, default=self.config_entry.options.get(CONF_PASSIVE, False)
+            ): bool,
+            vol.Required(
+                CONF_IDLE_TIMEOUT, default=self.config_entry.options.get(CONF_IDLE_TIMEOUT, 0)
+            ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+            vol.Required(
+                CONF_PREWARM_RSSI, default=self.config_entry.options.get(CONF_PREWARM_RSSI, DEFAULT_PREWARM_RSSI)
+            ): vol.All(vol.Coerce(int), vol.Range(min=-127, max=0)),
+            vol.Required(
+                CONF_POSITION_MIN_INTERVAL,
+                default=self.config_entry.options.get(CONF_POSITION_MIN_INTERVAL, DEFAULT_POSITION_MIN_INTERVAL),
+            ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+            vol.Required(
+                CONF_POSITION_MIN_DELTA,
+                default=self.config_entry.options.get(CONF_POSITION_MIN_DELTA, DEFAULT_POSITION_MIN_DELTA),
+            ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+            vol.Required(
+                CONF_WATCHDOG_INTERVAL,
+                default=self.config_entry.options.get(CONF_WATCHDOG_INTERVAL, DEFAULT_WATCHDOG_INTERVAL),
+            ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+            vol.Required(
+                CONF_WATCHDOG_MISSES,
+                default=self.config_entry.options.get(CONF_WATCHDOG_MISSES, DEFAULT_WATCHDOG_MISSES),
+            ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        })
+
+        return self.async_show_form(step_id="init", data_schema=options_schema)
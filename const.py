@@ -1,3 +1,58 @@
 """Constants for the SesameOS 3 integration."""
 
 DOMAIN = "sesameos3"
+
+# Upper bound on BLE connection attempts in flight per adapter or proxy
+MAX_CONNECTS_PER_SOURCE = 2
+# Seconds between re-scoring the sources that hear a device
+ROUTING_INTERVAL = 10
+# Move a connection when another source hears the device this many dB better
+MIGRATION_MARGIN = 10
+MIGRATION_COOLDOWN = 300
+
+CONF_PASSIVE = "passive"
+CONF_IDLE_TIMEOUT = "idle_timeout"
+CONF_PREWARM_RSSI = "prewarm_rssi"
+CONF_POSITION_MIN_INTERVAL = "position_min_interval"
+CONF_POSITION_MIN_DELTA = "position_min_delta"
+CONF_WATCHDOG_INTERVAL = "watchdog_interval"
+CONF_WATCHDOG_MISSES = "watchdog_misses"
+# Seconds an on-demand connection is kept after the last command in passive mode
+PASSIVE_IDLE_TIMEOUT = 30
+DEFAULT_PREWARM_RSSI = -60
+# An idle lock must be heard this many dB below the pre-warm RSSI before it can be pre-warmed again
+PREWARM_HYSTERESIS = 5
+# Position/target updates while the motor turns; the final value is always written
+DEFAULT_POSITION_MIN_INTERVAL = 1.0
+DEFAULT_POSITION_MIN_DELTA = 0
+# Seconds without frames before a connected lock is probed, and failed probes before reconnecting
+DEFAULT_WATCHDOG_INTERVAL = 60
+DEFAULT_WATCHDOG_MISSES = 2
+WATCHDOG_PROBE_TIMEOUT = 5
+# Number of latency samples kept per measurement
+LATENCY_SAMPLES = 100
+
+# CANDY HOUSE manufacturer data: product type (2 bytes), status byte, device UUID (16 bytes)
+MANUFACTURER_ID = 0x055A
+ADV_STATUS_REGISTERED = 0x01
+ADV_STATUS_LOCKED = 0x02
+ADV_STATUS_CRITICAL = 0x04
+# Product type of the Sesame 5, the only product this integration supports
+PRODUCT_SESAME_5 = 5
+# Unconfigured Sesame devices remembered for config flows
+DISCOVERY_CACHE_SIZE = 64
+
+# Seconds to wait for further angle edits before writing mech settings
+SETTINGS_COALESCE_WINDOW = 0.5
+
+# Retries of lock_all/unlock_all per lock after a failed attempt
+BULK_RETRIES = 2
+BULK_RETRY_DELAY = 1.0
+
+# Fired with a lock's history entry for each movement that settled while connected, described in the logbook
+EVENT_HISTORY = f"{DOMAIN}_history"
+
+# Status frames of a movement used to estimate the motor's angular velocity
+MOTION_WINDOW = 5
+# Degrees around the configured lock/unlock angle at which a moving motor counts as arrived
+MOTION_RANGE_TOLERANCE = 10
@@ -1,16 +1,35 @@
 import asyncio
-import copy
-from typing import Optional
-from homeassistant.const import EntityCategory, Platform, CONF_MAC
+from collections.abc import Callable
+from dataclasses import asdict
+from datetime import datetime, timedelta
+import logging
+import time
+from typing import Any, Optional
+from homeassistant.const import (
+    EntityCategory,
+    Platform,
+    CONF_MAC,
+    SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+    UnitOfTime,
+)
 from homeassistant.components.number import NumberEntity, NumberDeviceClass, NumberMode
 from homeassistant.components.lock import LockEntity
-from homeassistant.components.sensor import SensorEntity, SensorDeviceClass
+from homeassistant.components.sensor import SensorEntity, SensorDeviceClass, SensorStateClass
 from homeassistant.components.binary_sensor import BinarySensorEntity, BinarySensorDeviceClass
+from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers.device_registry import format_mac
+from homeassistant.util import dt as dt_util
 
-from sesameos3client import Event, SesameClient, EventData
+from sesameos3client import EventData
 
-from .models import SesameDevice
+from .const import MOTION_RANGE_TOLERANCE, SETTINGS_COALESCE_WINDOW
+from .metrics import RollingStats
+from .models import CommandSuperseded, SesameDevice
+from .motion import MotionEstimator
+from .statistics import HourlyStatistics
+from .trace import async_replay_trace
+
+_LOGGER = logging.getLogger(__name__)
 
 class Sesame5(SesameDevice):
     class MechStatusSensor(SesameDevice.Entity, SensorEntity):
@@ -23,9 +42,12 @@ class Sesame5(SesameDevice):
                      icon: str = "mdi:information",
                      unit: Optional[str] = None,
                      device_class: Optional[SensorDeviceClass] = None,
-                     default_disabled: bool = False) -> None:
+                     default_disabled: bool = False,
+                     rate_limited: bool = False) -> None:
             super().__init__(device)
             self._value_name = attr_name
+            self._rate_limited = rate_limited
+            self._last_write = 0.0
             self._attr_translation_key = attr_name
             self._attr_icon = icon
             self._attr_native_unit_of_measurement = unit
@@ -33,20 +55,75 @@ class Sesame5(SesameDevice):
             self._attr_unique_id = format_mac(device.entry.data[CONF_MAC]) + "_" + attr_name
             self._attr_device_info = device.device_info
             self._attr_entity_registry_enabled_default = not default_disabled
-            if device.client.mech_status is not None:
-                self._attr_native_value = getattr(device.client.mech_status, self._value_name)
+            if device.mech_status is not None:
+                self._attr_native_value = getattr(device.mech_status, self._value_name)
 
         async def async_added_to_hass(self) -> None:
             await super().async_added_to_hass()
-            self._client.add_listener(Event.MechStatusEvent, self._on_mech_status)
+            # Rate-limited sensors also watch stop so the final value is always written
+            watched = (self._value_name, "stop") if self._rate_limited else (self._value_name,)
+            self.async_on_remove(self._dispatcher.subscribe(self._on_mech_status, watched))
+            # The dispatcher only reports changes, so catch up on frames published before subscribing
+            if (status := self._dispatcher.last) is not None:
+                self._on_mech_status(status)
 
-        async def async_will_remove_from_hass(self) -> None:
-            self._client.remove_listener(Event.MechStatusEvent, self._on_mech_status)
-            await super().async_will_remove_from_hass()
+        def _on_mech_status(self, status: EventData.MechStatus) -> None:
+            value = getattr(status, self._value_name)
+            if value == self._attr_native_value:
+                return
+            if self._rate_limited and not status.stop:
+                now = time.monotonic()
+                if now - self._last_write < self._device.position_min_interval:
+                    return
+                if self._attr_native_value is not None and value is not None \
+                        and abs(value - self._attr_native_value) < self._device.position_min_delta:
+                    return
+                self._last_write = now
+            self._attr_native_value = value
+            self._dispatcher.schedule_write(self)
 
-        def _on_mech_status(self, event: Event.MechStatusEvent, metadata) -> None:
-            self._attr_native_value = getattr(event.response, self._value_name)
-            self.async_write_ha_state()
+    class LinkMetricSensor(SesameDevice.Entity, SensorEntity):
+        """Diagnostic view of latency and link health, refreshed by polling."""
+        _attr_has_entity_name = True
+        _attr_should_poll = True
+        _attr_entity_category = EntityCategory.DIAGNOSTIC
+        _attr_entity_registry_enabled_default = False
+        _attr_state_class = SensorStateClass.MEASUREMENT
+        _unrecorded_attributes = frozenset({
+            "count", "last", "p50", "p95", "p99", "attempts", "successes", "failures", "debounced",
+        })
+
+        def __init__(self, device: "Sesame5",
+                     attr_name: str,
+                     value_fn: Callable[["Sesame5"], tuple[Any, Optional[dict[str, Any]]]],
+                     icon: str = "mdi:timer-outline",
+                     unit: Optional[str] = UnitOfTime.SECONDS,
+                     device_class: Optional[SensorDeviceClass] = SensorDeviceClass.DURATION,
+                     state_class: SensorStateClass = SensorStateClass.MEASUREMENT) -> None:
+            super().__init__(device)
+            self._value_fn = value_fn
+            self._attr_translation_key = attr_name
+            self._attr_icon = icon
+            self._attr_native_unit_of_measurement = unit
+            self._attr_device_class = device_class
+            self._attr_state_class = state_class
+            self._attr_unique_id = format_mac(device.entry.data[CONF_MAC]) + "_" + attr_name
+            self._attr_device_info = device.device_info
+
+        @property
+        def available(self) -> bool:
+            return True # Link metrics stay meaningful while disconnected
+
+        async def async_update(self) -> None:
+            self._attr_native_value, self._attr_extra_state_attributes = self._value_fn(self._device)
+
+        @staticmethod
+        def latency(get_stats: Callable[["Sesame5"], RollingStats]):
+            def value(device: "Sesame5") -> tuple[Any, Optional[dict[str, Any]]]:
+                stats = get_stats(device)
+                median = stats.percentile(50)
+                return (round(median, 3) if median is not None else None), stats.as_dict()
+            return value
 
     class MechStatusBinarySensor(SesameDevice.Entity, BinarySensorEntity):
         _attr_has_entity_name = True
@@ -66,30 +143,33 @@ class Sesame5(SesameDevice):
             self._attr_unique_id = format_mac(device.entry.data[CONF_MAC]) + "_" + attr_name
             self._attr_device_info = device.device_info
             self._attr_entity_registry_enabled_default = not default_disabled
-            if device.client.mech_status is not None:
-                self._attr_is_on = getattr(device.client.mech_status, self._value_name)
+            if device.mech_status is not None:
+                self._attr_is_on = getattr(device.mech_status, self._value_name)
 
         async def async_added_to_hass(self) -> None:
             await super().async_added_to_hass()
-            self._client.add_listener(Event.MechStatusEvent, self._on_mech_status)
+            self.async_on_remove(
+                self._dispatcher.subscribe(self._on_mech_status, (self._value_name,))
+            )
+            # The dispatcher only reports changes, so catch up on frames published before subscribing
+            if (status := self._dispatcher.last) is not None:
+                self._on_mech_status(status)
 
-        async def async_will_remove_from_hass(self) -> None:
-            self._client.remove_listener(Event.MechStatusEvent, self._on_mech_status)
-            await super().async_will_remove_from_hass()
-
-        def _on_mech_status(self, event: Event.MechStatusEvent, metadata) -> None:
-            self._attr_is_on = getattr(event.response, self._value_name)
-            self.async_write_ha_state()
+        def _on_mech_status(self, status: EventData.MechStatus) -> None:
+            self._attr_is_on = getattr(status, self._value_name)
+            self._dispatcher.schedule_write(self)
 
     class SesameLock(SesameDevice.Entity, LockEntity):
         _attr_has_entity_name = True
         _last_mechstatus: Optional[EventData.MechStatus]
         _attr_should_poll = False
         _attr_translation_key = "sesame_lock"
+        _WATCHED_ATTRS = ("lock_range", "stop", "clockwise")
+        _unrecorded_attributes = frozenset({"estimated_completion"})
         def __init__(self, device: "Sesame5") -> None:
             super().__init__(device)
             self._attr_unique_id = format_mac(device.entry.data[CONF_MAC])
-            self._last_mechstatus = self._client.mech_status
+            self._last_mechstatus = device.mech_status
             self._attr_name = None
             self._attr_device_info = device.device_info
             if self._last_mechstatus is not None:
@@ -99,23 +179,34 @@ class Sesame5(SesameDevice):
 
         async def async_added_to_hass(self) -> None:
             await super().async_added_to_hass()
-            self._client.add_listener(Event.MechStatusEvent, self._on_mech_status)
+            self.async_on_remove(
+                self._dispatcher.subscribe(self._on_mech_status, self._WATCHED_ATTRS)
+            )
+            # The dispatcher only reports changes, so catch up on frames published before subscribing
+            if (status := self._dispatcher.last) is not None:
+                self._on_mech_status(status)
 
-        async def async_will_remove_from_hass(self) -> None:
-            self._client.remove_listener(Event.MechStatusEvent, self._on_mech_status)
-            await super().async_will_remove_from_hass()
+        @property
+        def extra_state_attributes(self) -> dict[str, Any]:
+            completion = self._device.estimated_completion
+            return {"estimated_completion": completion.isoformat() if completion is not None else None}
+
+        def _on_availability_changed(self) -> None:
+            super()._on_availability_changed()
+            if self._client.is_connected and self._attr_changed_by is None:
+                self.hass.async_create_task(self.set_changed_by())
 
         async def async_lock(self, **kwargs) -> None:
             self._attr_assumed_state = True
             self._attr_is_locking = True
             self.async_write_ha_state()
             try:
-                await asyncio.gather(
-                    self._client.lock("Home Assistant"),
-                    self._client.wait_for(Event.MechStatusEvent)
-                )
+                # changed_by is refreshed once the motor settles, see _on_mech_status
+                if not await self._device.commands.lock():
+                    raise CommandSuperseded(f"Locking {self._device.entry.title} was superseded by a newer command")
             finally:
                 if self._attr_assumed_state:
+                    self._attr_assumed_state = False
                     self._attr_is_locking = False
                     self.async_write_ha_state()
 
@@ -124,24 +215,57 @@ class Sesame5(SesameDevice):
             self._attr_is_unlocking = True
             self.async_write_ha_state()
             try:
-                await asyncio.gather(
-                    self._client.unlock("Home Assistant"),
-                    self._client.wait_for(Event.MechStatusEvent)
-                )
+                if not await self._device.commands.unlock():
+                    raise CommandSuperseded(f"Unlocking {self._device.entry.title} was superseded by a newer command")
             finally:
                 if self._attr_assumed_state:
+                    self._attr_assumed_state = False
                     self._attr_is_unlocking = False
                     self.async_write_ha_state()
 
-        async def _on_mech_status(self, event: Event.MechStatusEvent, metadata) -> None:
+        async def async_prewarm(self) -> None:
+            await self._device.async_prewarm()
+
+        async def async_start_trace(self, path: Optional[str] = None) -> None:
+            if path is not None and not self.hass.config.is_allowed_path(path):
+                raise ServiceValidationError(f"Writing to {path} is not allowed")
+            _LOGGER.info("Recording %s events to %s", self._device.entry.title, self._device.start_trace(path))
+
+        async def async_stop_trace(self) -> None:
+            await self._device.async_stop_trace()
+
+        async def async_replay_trace(self, path: str, speed: float = 1.0) -> dict[str, Any]:
+            if not self.hass.config.is_allowed_path(path):
+                raise ServiceValidationError(f"Reading {path} is not allowed")
+            return await async_replay_trace(self._device, path, speed)
+
+        async def async_get_history_tail(self) -> dict[str, Any]:
+            async with self._device.connected():
+                result = await self._device.get_history_tail()
+            return {"type": result.response.type.name if result.response is not None else None}
+
+        async def async_apply_settings(self, lock: Optional[int] = None,
+                                       unlock: Optional[int] = None,
+                                       auto_lock_seconds: Optional[int] = None) -> None:
+            edits = {name: value for name, value in (("lock", lock), ("unlock", unlock)) if value is not None}
+            updates = []
+            if edits:
+                updates.append(self._device.async_update_mech_settings(**edits))
+            if auto_lock_seconds is not None:
+                updates.append(self._device.commands.set_autolock_time(auto_lock_seconds))
+            await asyncio.gather(*updates)
+
+        def _on_mech_status(self, status: EventData.MechStatus) -> None:
             self._attr_assumed_state = False
-            self._last_mechstatus = event.response
+            previous = self._last_mechstatus
+            settled = status.stop and (previous is None or not previous.stop or previous.lock_range != status.lock_range)
+            self._last_mechstatus = status
             if not self._last_mechstatus.stop:
-                if self._client.mech_settings is None: # Keep these state unknown when we can't determine them
+                if (mech_settings := self._device.mech_settings) is None: # Keep these state unknown when we can't determine them
                     self._attr_is_locking = None
                     self._attr_is_unlocking = None
                 else:
-                    if self._last_mechstatus.clockwise == self._client.mech_settings.lock < self._client.mech_settings.unlock:
+                    if self._last_mechstatus.clockwise == mech_settings.lock < mech_settings.unlock:
                         self._attr_is_locking = True
                         self._attr_is_unlocking = False
                     else:
@@ -151,12 +275,13 @@ class Sesame5(SesameDevice):
                 self._attr_is_locking = False
                 self._attr_is_unlocking = False
             self._attr_is_locked = self._last_mechstatus.lock_range
-            self.async_write_ha_state()
-            await self.set_changed_by()
+            self._dispatcher.schedule_write(self)
+            if settled and self._client.is_connected: # The device already invalidated the history tail
+                self.hass.async_create_task(self.set_changed_by())
 
         async def set_changed_by(self):
             history_type = EventData.HistoryData.HistoryType
-            hist_entry = await self._client.get_history_tail()
+            hist_entry = await self._device.get_history_tail()
             if hist_entry.response is not None:
                 match hist_entry.response.type:
                     case history_type.AUTOLOCK:
@@ -184,8 +309,8 @@ class Sesame5(SesameDevice):
                      device_class: Optional[NumberDeviceClass] = None) -> None:
             super().__init__(device)
             self._value_name = attr_name
-            if device.client.mech_settings is not None:
-                self._attr_native_value = getattr(device.client.mech_settings, self._value_name)
+            if device.mech_settings is not None:
+                self._attr_native_value = getattr(device.mech_settings, self._value_name)
             self._attr_unique_id = format_mac(device.entry.data[CONF_MAC]) + "_" + attr_name
             self._attr_translation_key = attr_name
             self._attr_icon = icon
@@ -197,62 +322,129 @@ class Sesame5(SesameDevice):
 
         async def async_added_to_hass(self) -> None:
             await super().async_added_to_hass()
-            self._client.add_listener(Event.MechSettingsEvent, self._on_mech_settings)
+            self.async_on_remove(
+                self._device.settings_dispatcher.subscribe(self._on_mech_settings, (self._value_name,))
+            )
+            if (settings := self._device.settings_dispatcher.last) is not None:
+                self._on_mech_settings(settings)
 
-        async def async_will_remove_from_hass(self) -> None:
-            self._client.remove_listener(Event.MechSettingsEvent, self._on_mech_settings)
-            await super().async_will_remove_from_hass()
-
-        def _on_mech_settings(self, event: Event.MechSettingsEvent, metadata) -> None:
-            self._attr_native_value = getattr(event.response, self._value_name)
-            self.async_write_ha_state()
+        def _on_mech_settings(self, settings) -> None:
+            self._attr_native_value = getattr(settings, self._value_name)
+            self._device.settings_dispatcher.schedule_write(self)
 
         async def async_set_native_value(self, value: float) -> None:
-            if self._client.mech_settings is None:
-                raise ValueError("Mech settings not available")
-            new_settings = copy.copy(self._client.mech_settings)
-            setattr(new_settings, self._value_name, int(value))
-            await self._client.set_mech_settings(new_settings.lock, new_settings.unlock)
+            await self._device.async_update_mech_settings(**{self._value_name: int(value)})
     class AutoLockTimeEntity(MechSettingsEntryEntity):
         def __init__(self, device: "Sesame5") -> None:
             super().__init__(device, "auto_lock_seconds", "s", (0, 65535), "mdi:timer-lock", NumberDeviceClass.DURATION)
 
         async def async_set_native_value(self, value: float) -> None:
-            await self._client.set_autolock_time(int(value))
+            await self._device.commands.set_autolock_time(int(value))
 
 
     offers = [Platform.LOCK, Platform.NUMBER, Platform.SENSOR, Platform.BINARY_SENSOR]
 
+    def __init__(self, hass, entry, client=None) -> None:
+        super().__init__(hass, entry, client)
+        self.lock: Optional[Sesame5.SesameLock] = None
+        self.motion = MotionEstimator()
+        self.statistics = HourlyStatistics(hass, self.store, entry.data[CONF_MAC], entry.title, {"battery": "mV", "position": "°"})
+        self.estimated_completion: Optional[datetime] = None
+        self._settings_edits: dict[str, int] = {}
+        self._settings_flush: Optional[asyncio.Task] = None
+
+    async def async_update_mech_settings(self, **edits: int) -> None:
+        """Change the lock and/or unlock angle.
+
+        Edits arriving within SETTINGS_COALESCE_WINDOW are merged into a single
+        write based on the latest known settings.
+        """
+        self._settings_edits.update(edits)
+        if self._settings_flush is None:
+            self._settings_flush = self.hass.async_create_task(self._async_flush_mech_settings())
+        await asyncio.shield(self._settings_flush)
+
+    async def _async_flush_mech_settings(self) -> None:
+        await asyncio.sleep(SETTINGS_COALESCE_WINDOW)
+        edits, self._settings_edits = self._settings_edits, {}
+        self._settings_flush = None
+        if (mech_settings := self.mech_settings) is None:
+            raise ValueError("Mech settings not available")
+        await self.commands.set_mech_settings(
+            edits.get("lock", mech_settings.lock), edits.get("unlock", mech_settings.unlock)
+        )
+
+    async def initialize(self):
+        await super().initialize()
+        self.entry.async_on_unload(self.statistics.start())
+
+    def _on_mech_status(self, status) -> None:
+        super()._on_mech_status(status)
+        # Advertised frames are synthesised from the last status and would skew the hourly mean
+        if not self.is_advertised(status):
+            self.statistics.add(status)
+        self.motion.update(status)
+        remaining = self.motion.remaining()
+        estimate = None if remaining is None else dt_util.utcnow() + timedelta(seconds=remaining)
+        previous = self.estimated_completion
+        # Only rewrite the lock when the estimate appears, disappears or shifts noticeably
+        if (previous is None) != (estimate is None) or (
+            estimate is not None and abs((estimate - previous).total_seconds()) > 0.5
+        ):
+            self.estimated_completion = estimate
+            if self.lock is not None and self.lock.hass is not None:
+                self.status_dispatcher.schedule_write(self.lock)
+
+    def reached(self, status, kind: str) -> bool:
+        """A frame heading for and already within MOTION_RANGE_TOLERANCE of the configured angle."""
+        if (mech_settings := self.mech_settings) is None:
+            return False
+        angle = getattr(mech_settings, kind)
+        return abs(status.target - angle) <= MOTION_RANGE_TOLERANCE \
+            and abs(status.position - angle) <= MOTION_RANGE_TOLERANCE
+
     async def populate_device_info(self) -> None:
-        await super().populate_device_info()
-        assert self.device_info is not None
         self.device_info["model"] = "Sesame 5"
+        await super().populate_device_info()
     
-    def get_entities(self, entity_type: Platform):
+    def _create_lock(self) -> "Sesame5.SesameLock":
+        self.lock = self.SesameLock(self)
+        return self.lock
+
+    def entity_factories(self, entity_type: Platform):
         match entity_type:
             case Platform.LOCK:
-                return [self.SesameLock(self)]
+                return [("", self._create_lock)]
             case Platform.NUMBER:
                 return [
-                    self.AutoLockTimeEntity(self),
-                    self.MechSettingsEntryEntity(self, "lock", "°", (-32768, 32767), "mdi:lock"),
-                    self.MechSettingsEntryEntity(self, "unlock", "°", (-32768, 32767), "mdi:lock-open-variant"),
+                    ("auto_lock_seconds", lambda: self.AutoLockTimeEntity(self)),
+                    ("lock", lambda: self.MechSettingsEntryEntity(self, "lock", "°", (-32768, 32767), "mdi:lock")),
+                    ("unlock", lambda: self.MechSettingsEntryEntity(self, "unlock", "°", (-32768, 32767), "mdi:lock-open-variant")),
                 ]
             case Platform.SENSOR:
                 return [
-                    self.MechStatusSensor(self, "battery", "mdi:battery", "mV", SensorDeviceClass.VOLTAGE, default_disabled=True),
-                    self.MechStatusSensor(self, "target", "mdi:target", "°", default_disabled=True),
-                    self.MechStatusSensor(self, "position", "mdi:angle-acute", "°", ),
+                    ("battery", lambda: self.MechStatusSensor(self, "battery", "mdi:battery", "mV", SensorDeviceClass.VOLTAGE, default_disabled=True)),
+                    ("target", lambda: self.MechStatusSensor(self, "target", "mdi:target", "°", default_disabled=True, rate_limited=True)),
+                    ("position", lambda: self.MechStatusSensor(self, "position", "mdi:angle-acute", "°", rate_limited=True)),
+                    ("connect_time", lambda: self.LinkMetricSensor(self, "connect_time", self.LinkMetricSensor.latency(lambda d: d.connection.connect_time))),
+                    ("lock_latency", lambda: self.LinkMetricSensor(self, "lock_latency", self.LinkMetricSensor.latency(lambda d: d.commands.latency.get("lock", RollingStats())))),
+                    ("unlock_latency", lambda: self.LinkMetricSensor(self, "unlock_latency", self.LinkMetricSensor.latency(lambda d: d.commands.latency.get("unlock", RollingStats())))),
+                    ("history_latency", lambda: self.LinkMetricSensor(self, "history_latency", self.LinkMetricSensor.latency(lambda d: d.history_latency))),
+                    ("recovery_time", lambda: self.LinkMetricSensor(self, "recovery_time", self.LinkMetricSensor.latency(lambda d: d.watchdog.recovery_time))),
+                    ("reconnects", lambda: self.LinkMetricSensor(self, "reconnects", lambda d: (d.connection.stats.successes, asdict(d.connection.stats)),
+                                                                 "mdi:bluetooth-connect", None, None, SensorStateClass.TOTAL_INCREASING)),
+                    ("rssi", lambda: self.LinkMetricSensor(self, "rssi", lambda d: (d.rssi, None),
+                                                           "mdi:signal", SIGNAL_STRENGTH_DECIBELS_MILLIWATT, SensorDeviceClass.SIGNAL_STRENGTH)),
                 ]
             case Platform.BINARY_SENSOR:
                 return [
-                    self.MechStatusBinarySensor(self, "clutch_failed", "mdi:alert", BinarySensorDeviceClass.PROBLEM, default_disabled=True),
-                    self.MechStatusBinarySensor(self, "lock_range", "mdi:lock", default_disabled=True),
-                    self.MechStatusBinarySensor(self, "unlock_range", "mdi:lock-open-variant", default_disabled=True),
-                    self.MechStatusBinarySensor(self, "critical", "mdi:alert-circle", BinarySensorDeviceClass.PROBLEM),
-                    self.MechStatusBinarySensor(self, "stop", "mdi:stop-circle", default_disabled=True),
-                    self.MechStatusBinarySensor(self, "low_battery", "mdi:battery-alert", BinarySensorDeviceClass.BATTERY),
-                    self.MechStatusBinarySensor(self, "clockwise", "mdi:rotate-right", default_disabled=True),
+                    ("clutch_failed", lambda: self.MechStatusBinarySensor(self, "clutch_failed", "mdi:alert", BinarySensorDeviceClass.PROBLEM, default_disabled=True)),
+                    ("lock_range", lambda: self.MechStatusBinarySensor(self, "lock_range", "mdi:lock", default_disabled=True)),
+                    ("unlock_range", lambda: self.MechStatusBinarySensor(self, "unlock_range", "mdi:lock-open-variant", default_disabled=True)),
+                    ("critical", lambda: self.MechStatusBinarySensor(self, "critical", "mdi:alert-circle", BinarySensorDeviceClass.PROBLEM)),
+                    ("stop", lambda: self.MechStatusBinarySensor(self, "stop", "mdi:stop-circle", default_disabled=True)),
+                    ("low_battery", lambda: self.MechStatusBinarySensor(self, "low_battery", "mdi:battery-alert", BinarySensorDeviceClass.BATTERY)),
+                    ("clockwise", lambda: self.MechStatusBinarySensor(self, "clockwise", "mdi:rotate-right", default_disabled=True)),
                 ]
             case _:
                 return []
@@ -0,0 +1,42 @@
+"""Diagnostics support for the SesameOS 3 integration."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.core import HomeAssistant
+
+from .models import SesameConfigEntry
+
+TO_REDACT = {"device_secret"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: SesameConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    device = entry.runtime_data
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "connected": device.client.is_connected,
+        "source": device.connection.source,
+        "connected_source": device.connected_source,
+        "source_rssi": device.sources.as_dict(),
+        "rssi": device.rssi,
+        "startup_timings": device.startup_timings,
+        "reconnects": asdict(device.connection.stats),
+        "watchdog": {
+            "misses": device.watchdog.misses,
+            "detection_time": device.watchdog.detection_time.as_dict(),
+            "recovery_time": device.watchdog.recovery_time.as_dict(),
+        },
+        "latency": {
+            "connect": device.connection.connect_time.as_dict(),
+            "history_tail": device.history_latency.as_dict(),
+            "commands": {kind: stats.as_dict() for kind, stats in device.commands.latency.items()},
+            "cold_commands": device.command_latency["cold"].as_dict(),
+            "warm_commands": device.command_latency["warm"].as_dict(),
+        },
+    }
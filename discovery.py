@@ -0,0 +1,119 @@
+"""Domain-wide routing of Sesame Bluetooth advertisements."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Optional
+
+from homeassistant.components import bluetooth
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .advertisement import SesameAdvertisement, parse_advertisement
+from .const import DISCOVERY_CACHE_SIZE, DOMAIN, MANUFACTURER_ID
+
+
+class DiscoveryIndex:
+    """Parses every CANDY HOUSE advertisement once and routes it by address or device UUID.
+
+    Advertisements of configured devices go to the callback their entry
+    registered. All others are kept in a bounded LRU keyed by raw device UUID
+    for config flows, which can also wait for a UUID to appear.
+    """
+
+    def __init__(self, hass: HomeAssistant, max_size: int = DISCOVERY_CACHE_SIZE) -> None:
+        self.hass = hass
+        self._max_size = max_size
+        self._routes: dict[str, Callable[[SesameAdvertisement], None]] = {}
+        self._devices: OrderedDict[bytes, SesameAdvertisement] = OrderedDict()
+        self._waiters: dict[bytes, list[asyncio.Future[SesameAdvertisement]]] = {}
+        self._unsubscribe: Optional[CALLBACK_TYPE] = None
+
+    def lookup(self, uuid: bytes) -> Optional[SesameAdvertisement]:
+        if (advertisement := self._devices.get(uuid)) is not None:
+            self._devices.move_to_end(uuid)
+        return advertisement
+
+    @callback
+    def async_register_device(self, address: str, device_callback: Callable[[SesameAdvertisement], None]) -> CALLBACK_TYPE:
+        """Route advertisements from `address` to `device_callback` until the returned callable is called.
+
+        The last advertisement already heard from `address` is delivered right away.
+        """
+        address = address.upper()
+        self._routes[address] = device_callback
+        if (service_info := bluetooth.async_last_service_info(self.hass, address, connectable=False)) is not None \
+                and (advertisement := parse_advertisement(service_info)) is not None:
+            self._devices.pop(advertisement.uuid, None)
+            device_callback(advertisement)
+
+        @callback
+        def unregister() -> None:
+            if self._routes.get(address) is device_callback:
+                del self._routes[address]
+        return unregister
+
+    @callback
+    def update(self, advertisement: SesameAdvertisement) -> None:
+        if self._waiters:
+            for future in self._waiters.pop(advertisement.uuid, []):
+                if not future.done():
+                    future.set_result(advertisement)
+        if (route := self._routes.get(advertisement.address.upper())) is not None:
+            route(advertisement)
+            return
+        self._devices[advertisement.uuid] = advertisement
+        self._devices.move_to_end(advertisement.uuid)
+        if len(self._devices) > self._max_size:
+            self._devices.popitem(last=False)
+
+    @callback
+    def _async_on_advertisement(self, service_info, change) -> None:
+        if (advertisement := parse_advertisement(service_info)) is not None:
+            self.update(advertisement)
+
+    async def async_wait(self, uuid: bytes, timeout: float) -> Optional[SesameAdvertisement]:
+        """Return the advertisement of `uuid`, waiting up to `timeout` seconds for it to appear."""
+        if (advertisement := self.lookup(uuid)) is not None:
+            return advertisement
+        future: asyncio.Future[SesameAdvertisement] = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(uuid, []).append(future)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except TimeoutError:
+            return None
+        finally:
+            if (waiters := self._waiters.get(uuid)) is not None and future in waiters:
+                waiters.remove(future)
+                if not waiters:
+                    del self._waiters[uuid]
+
+
+@callback
+def async_get_discovery_index(hass: HomeAssistant) -> DiscoveryIndex:
+    """Return the domain-wide discovery index, subscribing to advertisements on first use.
+
+    This is the only advertisement callback of the integration. It also
+    receives advertisements relayed by passive scanners; connectable
+    devices skip those themselves.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (index := domain_data.get("discovery")) is None:
+        index = domain_data["discovery"] = DiscoveryIndex(hass)
+        for service_info in bluetooth.async_discovered_service_info(hass, connectable=False):
+            index._async_on_advertisement(service_info, None)
+        index._unsubscribe = bluetooth.async_register_callback(
+            hass,
+            index._async_on_advertisement,
+            {"manufacturer_id": MANUFACTURER_ID, "connectable": False},
+            bluetooth.BluetoothScanningMode.ACTIVE,
+        )
+    return index
+
+
+@callback
+def async_release_discovery_index(hass: HomeAssistant) -> None:
+    """Stop receiving advertisements and drop the index, e.g. once the last entry unloaded."""
+    if (index := hass.data.get(DOMAIN, {}).pop("discovery", None)) is not None and index._unsubscribe is not None:
+        index._unsubscribe()
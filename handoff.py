@@ -0,0 +1,67 @@
+"""Hand the config flow's authenticated connection over to the new entry."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+from typing import Optional
+
+from sesameos3client import SesameClient
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.device_registry import format_mac
+from homeassistant.helpers.event import async_call_later
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# Seconds a validated connection waits for its entry before it is dropped
+HANDOFF_TIMEOUT = 60
+
+
+@dataclass
+class _Handoff:
+    client: SesameClient
+    device_secret: str
+    cancel_expiry: CALLBACK_TYPE
+
+
+def _handoffs(hass: HomeAssistant) -> dict[str, _Handoff]:
+    return hass.data.setdefault(DOMAIN, {}).setdefault("handoff", {})
+
+
+@callback
+def async_store_handoff(hass: HomeAssistant, mac: str, device_secret: str, client: SesameClient) -> None:
+    """Keep `client` connected for a short while so the entry set up next can reuse it."""
+    key = format_mac(mac)
+    if (previous := _handoffs(hass).pop(key, None)) is not None:
+        previous.cancel_expiry()
+        hass.async_create_task(previous.client.disconnect())
+
+    async def _async_expire(_now) -> None:
+        if (handoff := _handoffs(hass).pop(key, None)) is not None:
+            _LOGGER.debug("Unclaimed connection to %s expired", mac)
+            await handoff.client.disconnect()
+
+    _handoffs(hass)[key] = _Handoff(client, device_secret, async_call_later(hass, HANDOFF_TIMEOUT, _async_expire))
+
+
+@callback
+def async_take_handoff(hass: HomeAssistant, mac: str, device_secret: str) -> Optional[SesameClient]:
+    """Return the connected client left by the config flow, or None if there is none usable."""
+    if (handoff := _handoffs(hass).pop(format_mac(mac), None)) is None:
+        return None
+    handoff.cancel_expiry()
+    if handoff.device_secret != device_secret or not handoff.client.is_connected:
+        hass.async_create_task(handoff.client.disconnect())
+        return None
+    return handoff.client
+
+
+@callback
+def async_discard_handoff(hass: HomeAssistant, mac: str) -> None:
+    """Drop the connection left for `mac`, e.g. when its flow aborted after all."""
+    if (handoff := _handoffs(hass).pop(format_mac(mac), None)) is not None:
+        handoff.cancel_expiry()
+        hass.async_create_task(handoff.client.disconnect())
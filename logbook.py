@@ -0,0 +1,37 @@
+"""Describe sesameos3 logbook events."""
+
+from homeassistant.components.logbook import (
+    LOGBOOK_ENTRY_ENTITY_ID,
+    LOGBOOK_ENTRY_MESSAGE,
+    LOGBOOK_ENTRY_NAME,
+)
+from homeassistant.core import Event, HomeAssistant, callback
+
+from .const import DOMAIN, EVENT_HISTORY
+
+MESSAGES = {
+    "AUTOLOCK": "was locked by auto-lock",
+    "BLE_LOCK": "was locked over Bluetooth",
+    "BLE_UNLOCK": "was unlocked over Bluetooth",
+    "WEB_LOCK": "was locked remotely",
+    "WEB_UNLOCK": "was unlocked remotely",
+    "MANUAL_LOCKED": "was locked manually",
+    "MANUAL_UNLOCKED": "was unlocked manually",
+    "MANUAL_ELSE": "was operated manually",
+}
+
+
+@callback
+def async_describe_events(hass: HomeAssistant, async_describe_event) -> None:
+    @callback
+    def async_describe_history_event(event: Event) -> dict[str, str]:
+        history_type = event.data["type"]
+        description = {
+            LOGBOOK_ENTRY_NAME: event.data["name"],
+            LOGBOOK_ENTRY_MESSAGE: MESSAGES.get(history_type, f"recorded {history_type}"),
+        }
+        if (entity_id := event.data.get("entity_id")) is not None:
+            description[LOGBOOK_ENTRY_ENTITY_ID] = entity_id
+        return description
+
+    async_describe_event(DOMAIN, EVENT_HISTORY, async_describe_history_event)
@@ -0,0 +1,40 @@
+"""Rolling latency statistics."""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Any, Optional
+
+from .const import LATENCY_SAMPLES
+
+
+class RollingStats:
+    """Keeps the last LATENCY_SAMPLES measurements and reports percentiles over them."""
+
+    def __init__(self) -> None:
+        self._samples: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def add(self, value: float) -> None:
+        self._samples.append(value)
+
+    @property
+    def last(self) -> Optional[float]:
+        return self._samples[-1] if self._samples else None
+
+    def percentile(self, percent: float) -> Optional[float]:
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "count": len(self._samples),
+            "last": self.last,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+        }
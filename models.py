@@ -1,12 +1,26 @@
 from abc import ABC, abstractmethod
 import asyncio
 import base64
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+import heapq
+import itertools
+import logging
+import random
+import time
+from types import SimpleNamespace
+from typing import Any, Optional
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, CALLBACK_TYPE
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform, CONF_MAC
-from homeassistant.helpers import device_registry
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import device_registry, entity_registry
 from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
 from homeassistant.helpers.device_registry import (
     format_mac,
     DeviceInfo,
@@ -16,36 +30,464 @@ from homeassistant.components import bluetooth
 
 from sesameos3client import Event, SesameClient
 
+from .advertisement import SesameAdvertisement
+from .const import (
+    CONF_IDLE_TIMEOUT,
+    CONF_PASSIVE,
+    CONF_POSITION_MIN_DELTA,
+    CONF_POSITION_MIN_INTERVAL,
+    CONF_PREWARM_RSSI,
+    CONF_WATCHDOG_INTERVAL,
+    CONF_WATCHDOG_MISSES,
+    DEFAULT_POSITION_MIN_DELTA,
+    DEFAULT_POSITION_MIN_INTERVAL,
+    DEFAULT_PREWARM_RSSI,
+    DEFAULT_WATCHDOG_INTERVAL,
+    DEFAULT_WATCHDOG_MISSES,
+    DOMAIN,
+    EVENT_HISTORY,
+    MAX_CONNECTS_PER_SOURCE,
+    MIGRATION_COOLDOWN,
+    MIGRATION_MARGIN,
+    PASSIVE_IDLE_TIMEOUT,
+    PREWARM_HYSTERESIS,
+    ROUTING_INTERVAL,
+)
+from .discovery import async_get_discovery_index
+from .handoff import async_take_handoff
+from .metrics import RollingStats
+from .storage import MECH_STATUS_FIELDS, SesameStore
+from .trace import TraceRecorder
+from .watchdog import LivenessWatchdog
+
+_LOGGER = logging.getLogger(__name__)
+
 type SesameConfigEntry = ConfigEntry[SesameDevice]
 
+class StateDispatcher:
+    """Fans out a client event to entities, waking only those whose watched attributes changed.
+
+    State writes requested while handling a frame are batched and flushed once
+    on the next event-loop tick.
+    """
+    def __init__(self, hass: HomeAssistant, client: SesameClient, event_type: type) -> None:
+        self.hass = hass
+        self._client = client
+        self._event_type = event_type
+        self._last: Optional[Any] = None
+        self._subscribers: dict[Callable[[Any], None], Optional[tuple[str, ...]]] = {}
+        self._pending_writes: dict[Entity, None] = {}
+        self._flush_handle: Optional[asyncio.Handle] = None
+
+    @property
+    def last(self) -> Optional[Any]:
+        return self._last
+
+    def start(self) -> None:
+        self._client.add_listener(self._event_type, self._on_event)
+
+    def stop(self) -> None:
+        self._client.remove_listener(self._event_type, self._on_event)
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._pending_writes.clear()
+
+    def subscribe(self, callback: Callable[[Any], None], attrs: Optional[Iterable[str]] = None) -> CALLBACK_TYPE:
+        """Call `callback` with the new value when any of `attrs` changed, or on every frame if `attrs` is None."""
+        self._subscribers[callback] = tuple(attrs) if attrs is not None else None
+        def unsubscribe() -> None:
+            self._subscribers.pop(callback, None)
+        return unsubscribe
+
+    def schedule_write(self, entity: Entity) -> None:
+        self._pending_writes[entity] = None
+        if self._flush_handle is None:
+            self._flush_handle = self.hass.loop.call_soon(self._flush)
+
+    def _on_event(self, event, metadata) -> None:
+        self.publish(event.response)
+
+    def publish(self, value: Any) -> None:
+        previous, self._last = self._last, value
+        for callback, attrs in list(self._subscribers.items()):
+            if previous is None or attrs is None or any(
+                getattr(previous, attr) != getattr(value, attr) for attr in attrs
+            ):
+                callback(value)
+
+    def _flush(self) -> None:
+        self._flush_handle = None
+        pending, self._pending_writes = self._pending_writes, {}
+        for entity in pending:
+            if entity.hass is not None:
+                entity.async_write_ha_state()
+
+@dataclass
+class ReconnectStats:
+    attempts: int = 0
+    successes: int = 0
+    failures: int = 0
+    debounced: int = 0
+
+class ConnectionScheduler:
+    """Shares BLE connection slots between all Sesame devices.
+
+    Connection attempts are bounded per adapter or proxy (the advertisement
+    source) and queued by priority, so user-initiated commands go ahead of
+    background reconnects.
+    """
+    PRIORITY_USER = 0
+    PRIORITY_BACKGROUND = 1
+
+    def __init__(self, slots_per_source: int = MAX_CONNECTS_PER_SOURCE) -> None:
+        self._slots = slots_per_source
+        self._active: dict[Optional[str], int] = {}
+        self._waiters: dict[Optional[str], list[tuple[int, int, asyncio.Future]]] = {}
+        self._sequence = itertools.count()
+
+    def queued(self, source: Optional[str]) -> int:
+        return sum(1 for _, _, future in self._waiters.get(source, []) if not future.done())
+
+    @asynccontextmanager
+    async def slot(self, source: Optional[str], priority: int):
+        await self._acquire(source, priority)
+        try:
+            yield
+        finally:
+            self._release(source)
+
+    async def _acquire(self, source: Optional[str], priority: int) -> None:
+        if self._active.get(source, 0) < self._slots and not self.queued(source):
+            self._active[source] = self._active.get(source, 0) + 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters.setdefault(source, []), (priority, next(self._sequence), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled(): # The slot was already handed over to us
+                self._release(source)
+            raise
+
+    def _release(self, source: Optional[str]) -> None:
+        waiters = self._waiters.get(source)
+        while waiters:
+            _, _, future = heapq.heappop(waiters)
+            if not future.done():
+                future.set_result(None) # Hand the slot over without freeing it
+                return
+        self._active[source] -= 1
+
+def get_scheduler(hass: HomeAssistant) -> ConnectionScheduler:
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if "scheduler" not in domain_data:
+        domain_data["scheduler"] = ConnectionScheduler()
+    return domain_data["scheduler"]
+
+class ConnectionManager:
+    """Owns the single reconnect task of a device.
+
+    Advertisements only request a reconnect; requests arriving while one is
+    running or while backing off after a failure are dropped.
+    """
+    SETTLE_DELAY = 2
+    BACKOFF_BASE = 5
+    BACKOFF_MAX = 300
+
+    def __init__(self, hass: HomeAssistant, client: SesameClient, name: str) -> None:
+        self.hass = hass
+        self._client = client
+        self._name = name
+        self.source: Optional[str] = None
+        self.stats = ReconnectStats()
+        self.connect_time = RollingStats()
+        self._task: Optional[asyncio.Task] = None
+        self._attempting = 0
+        self._holding_slot = False
+        self._consecutive_failures = 0
+        self._not_before = 0.0
+
+    def _busy(self) -> bool:
+        return self._attempting > 0 or (self._task is not None and not self._task.done())
+
+    def request_connect(self) -> None:
+        if self._client.is_connected or self._busy() or time.monotonic() < self._not_before:
+            self.stats.debounced += 1
+            return
+        self._task = self.hass.async_create_background_task(
+            self._reconnect(), f"{DOMAIN} reconnect {self._name}"
+        )
+
+    async def connect(self, priority: int = ConnectionScheduler.PRIORITY_BACKGROUND) -> None:
+        """Connect now, joining a reconnect that already holds a connection slot."""
+        if self._client.is_connected:
+            return
+        if self._task is not None and not self._task.done():
+            if self._holding_slot:
+                await asyncio.shield(self._task)
+            else: # Still settling or queued behind other devices; go ahead with our own priority
+                self._task.cancel()
+        if not self._client.is_connected:
+            await self._attempt(priority)
+
+    def cancel(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _reconnect(self) -> None:
+        await asyncio.sleep(self.SETTLE_DELAY)
+        try:
+            await self._attempt(ConnectionScheduler.PRIORITY_BACKGROUND)
+        except Exception as e:
+            _LOGGER.debug("Reconnect to %s failed: %s", self._name, e)
+
+    async def _attempt(self, priority: int) -> None:
+        self._attempting += 1
+        try:
+            async with get_scheduler(self.hass).slot(self.source, priority):
+                if self._client.is_connected:
+                    return
+                self._holding_slot = True
+                self.stats.attempts += 1
+                started = time.monotonic()
+                await self._client.connect()
+                self.connect_time.add(time.monotonic() - started)
+        except Exception:
+            self.stats.failures += 1
+            self._consecutive_failures += 1
+            delay = min(self.BACKOFF_MAX, self.BACKOFF_BASE * 2 ** (self._consecutive_failures - 1))
+            self._not_before = time.monotonic() + random.uniform(delay / 2, delay)
+            raise
+        else:
+            if self._client.is_connected:
+                self.stats.successes += 1
+                self._consecutive_failures = 0
+                self._not_before = 0.0
+        finally:
+            self._attempting -= 1
+            self._holding_slot = False
+
+class SourceTracker:
+    """Scores the adapters and proxies that hear a device by their smoothed RSSI."""
+    SMOOTHING = 0.3
+
+    def __init__(self) -> None:
+        self._rssi: dict[str, float] = {}
+
+    def refresh(self, hass: HomeAssistant, address: str) -> None:
+        seen = set()
+        for scanner_device in bluetooth.async_scanner_devices_by_address(hass, address, connectable=True):
+            source = scanner_device.scanner.source
+            rssi = scanner_device.advertisement.rssi
+            seen.add(source)
+            previous = self._rssi.get(source)
+            self._rssi[source] = rssi if previous is None else previous + self.SMOOTHING * (rssi - previous)
+        for source in set(self._rssi) - seen: # No longer hears the device
+            del self._rssi[source]
+
+    def rssi(self, source: Optional[str]) -> Optional[float]:
+        return self._rssi.get(source) if source is not None else None
+
+    def best(self) -> Optional[str]:
+        return max(self._rssi, key=self._rssi.__getitem__, default=None)
+
+    def sole(self) -> Optional[str]:
+        """The only source that hears the device, if there is exactly one."""
+        return next(iter(self._rssi)) if len(self._rssi) == 1 else None
+
+    def as_dict(self) -> dict[str, float]:
+        return {source: round(rssi, 1) for source, rssi in self._rssi.items()}
+
+class CommandSuperseded(HomeAssistantError):
+    """A queued command was dropped in favour of a newer one before it was sent."""
+
+class Command:
+    def __init__(self, kind: str, group: str,
+                 send: Callable[[], Awaitable[Any]],
+                 reflected: Optional[Callable[[Any], bool]] = None) -> None:
+        self.kind = kind
+        self.group = group
+        self.send = send
+        self.reflected = reflected
+        self.future: asyncio.Future[bool] = asyncio.get_running_loop().create_future()
+        self.status_seen: Optional[asyncio.Future[None]] = None
+
+class CommandQueue:
+    """Serializes commands to a device.
+
+    A new command joins a pending one of the same kind and supersedes pending
+    ones of the same group, e.g. an unlock queued behind a lock drops the
+    lock. Commands with a `reflected` predicate complete once a status frame
+    satisfies it.
+    """
+    STATUS_TIMEOUT = 10
+
+    def __init__(self, device: "SesameDevice") -> None:
+        self._device = device
+        self._pending: deque[Command] = deque()
+        self._current: Optional[Command] = None
+        self._worker: Optional[asyncio.Task] = None
+        self.latency: dict[str, RollingStats] = {}
+
+    def start(self) -> CALLBACK_TYPE:
+        return self._device.status_dispatcher.subscribe(self._on_status)
+
+    @property
+    def busy(self) -> bool:
+        return self._current is not None or bool(self._pending)
+
+    def stop(self) -> None:
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+        # The cancelled worker never resolves them; callers wait on the futures, not the worker
+        commands = [self._current] if self._current is not None else []
+        commands.extend(self._pending)
+        self._current = None
+        self._pending.clear()
+        for command in commands:
+            if not command.future.done():
+                command.future.set_exception(HomeAssistantError(f"{self._device.entry.title} was unloaded"))
+
+    async def lock(self) -> bool:
+        return await self.submit(Command(
+            "lock", "motion", lambda: self._device.client.lock("Home Assistant"),
+            lambda status: status.lock_range and status.stop or self._device.reached(status, "lock"),
+        ))
+
+    async def unlock(self) -> bool:
+        return await self.submit(Command(
+            "unlock", "motion", lambda: self._device.client.unlock("Home Assistant"),
+            lambda status: status.unlock_range and status.stop or self._device.reached(status, "unlock"),
+        ))
+
+    async def set_mech_settings(self, lock: int, unlock: int) -> bool:
+        return await self.submit(Command(
+            "mech_settings", "mech_settings", lambda: self._device.client.set_mech_settings(lock, unlock),
+        ))
+
+    async def set_autolock_time(self, seconds: int) -> bool:
+        return await self.submit(Command(
+            "autolock_time", "autolock_time", lambda: self._device.client.set_autolock_time(seconds),
+        ))
+
+    async def submit(self, command: Command) -> bool:
+        """Queue `command`; returns False if a newer command superseded it before it was sent."""
+        for pending in list(self._pending):
+            if pending.group != command.group:
+                continue
+            if pending.kind == command.kind and command.reflected is not None:
+                return await asyncio.shield(pending.future)
+            self._pending.remove(pending)
+            pending.future.set_result(False)
+        self._pending.append(command)
+        if self._worker is None or self._worker.done():
+            self._worker = self._device.hass.async_create_background_task(
+                self._run(), f"{DOMAIN} commands {self._device.entry.title}"
+            )
+        return await asyncio.shield(command.future)
+
+    def _on_status(self, status) -> None:
+        command = self._current
+        if command is not None and command.status_seen is not None and not command.status_seen.done() \
+                and command.reflected(status):
+            command.status_seen.set_result(None)
+
+    async def _run(self) -> None:
+        while self._pending:
+            command = self._current = self._pending.popleft()
+            started = time.monotonic()
+            try:
+                async with self._device.connected():
+                    if command.reflected is not None:
+                        command.status_seen = asyncio.get_running_loop().create_future()
+                    await command.send()
+                    if command.status_seen is not None:
+                        try:
+                            await asyncio.wait_for(command.status_seen, self.STATUS_TIMEOUT)
+                        except TimeoutError:
+                            # No new frame; fine as long as the device already is where we wanted
+                            if (status := self._device.mech_status) is None or not command.reflected(status):
+                                raise
+            except Exception as e:
+                if not command.future.done():
+                    command.future.set_exception(e)
+            else:
+                elapsed = time.monotonic() - started
+                self.latency.setdefault(command.kind, RollingStats()).add(elapsed)
+                _LOGGER.debug("%s on %s completed in %.2fs", command.kind, self._device.entry.title, elapsed)
+                if not command.future.done():
+                    command.future.set_result(True)
+            finally:
+                self._current = None
+
 class SesameDevice(ABC):
     offers: list[Platform] = []
     device_info: DeviceInfo
 
     class Entity(Entity, ABC):
         def __init__(self, device: "SesameDevice") -> None:
+            self._device = device
             self._client = device.client
+            self._dispatcher = device.status_dispatcher
 
         async def async_added_to_hass(self) -> None:
             await super().async_added_to_hass()
-            self._client.on_disconnected(self._on_disconnected)
-            self._client.on_connected(self._on_connected)
-            self._attr_available = self._client.is_connected
-            
-        def _on_disconnected(self) -> None:
-            self._attr_available = False
-            self.async_write_ha_state()
+            self.async_on_remove(self._device.add_availability_listener(self._on_availability_changed))
+            self._attr_available = self._device.available
 
-        def _on_connected(self) -> None:
-            self._attr_available = True
+        def _on_availability_changed(self) -> None:
+            self._attr_available = self._device.available
             self.async_write_ha_state()
 
-    def __init__(self, hass: HomeAssistant, entry: SesameConfigEntry) -> None:
+    def __init__(self, hass: HomeAssistant, entry: SesameConfigEntry, client: Optional[SesameClient] = None) -> None:
         self.hass = hass
-        self.client = SesameClient(
+        self.client = client or async_take_handoff(hass, entry.data[CONF_MAC], entry.data["device_secret"]) or SesameClient(
             entry.data[CONF_MAC], base64.b64decode(entry.data["device_secret"])
         )
         self.entry = entry
+        self.status_dispatcher = StateDispatcher(hass, self.client, Event.MechStatusEvent)
+        self.settings_dispatcher = StateDispatcher(hass, self.client, Event.MechSettingsEvent)
+        self.connection = ConnectionManager(hass, self.client, entry.title)
+        self.commands = CommandQueue(self)
+        self.store = SesameStore(hass, entry.entry_id)
+        self.startup_timings: dict[str, float] = {}
+        self.passive = entry.options.get(CONF_PASSIVE, False)
+        self.idle_timeout: int = entry.options.get(CONF_IDLE_TIMEOUT, 0) or (PASSIVE_IDLE_TIMEOUT if self.passive else 0)
+        self.prewarm_rssi: int = entry.options.get(CONF_PREWARM_RSSI, DEFAULT_PREWARM_RSSI)
+        self.position_min_interval: float = entry.options.get(CONF_POSITION_MIN_INTERVAL, DEFAULT_POSITION_MIN_INTERVAL)
+        self.position_min_delta: float = entry.options.get(CONF_POSITION_MIN_DELTA, DEFAULT_POSITION_MIN_DELTA)
+        self.command_latency: dict[str, RollingStats] = {"cold": RollingStats(), "warm": RollingStats()}
+        self.history_latency = RollingStats()
+        self.rssi: Optional[int] = None
+        self.sources = SourceTracker()
+        self.trace: Optional[TraceRecorder] = None
+        self.watchdog = LivenessWatchdog(
+            self,
+            entry.options.get(CONF_WATCHDOG_INTERVAL, DEFAULT_WATCHDOG_INTERVAL),
+            entry.options.get(CONF_WATCHDOG_MISSES, DEFAULT_WATCHDOG_MISSES),
+        )
+        self.connected_source: Optional[str] = None
+        self._last_routing = 0.0
+        self._last_migration = 0.0
+        self._restored = False
+        self._present = False
+        self._idle = False
+        self._sessions = 0
+        self._idle_disconnect: Optional[CALLBACK_TYPE] = None
+        self._advertised_status: Optional[SimpleNamespace] = None
+        self._prewarm_armed = False
+        self._migrating = False
+        self._availability_listeners: list[Callable[[], None]] = []
+        self._device_info_task: Optional[asyncio.Task] = None
+        self._history_generation = 0
+        self._last_reported: Optional[Any] = None
+        self._history_cache: Optional[tuple[int, Any]] = None
+        self._history_inflight: Optional[tuple[int, asyncio.Task]] = None
+        self._entities: dict[Platform, list[Entity]] = {}
+        self.platforms: list[Platform] = []
         self.device_info = DeviceInfo(
             identifiers={(self.entry.domain, format_mac(self.entry.data[CONF_MAC]))},
             connections={(CONNECTION_BLUETOOTH, self.entry.data[CONF_MAC])},
@@ -53,45 +495,395 @@ class SesameDevice(ABC):
             manufacturer="CANDY HOUSE JAPAN, Inc.",
         )
 
-    def _async_device_found(self, _service_info, change) -> None:
-        self.hass.async_create_task(self._on_found())
+    @property
+    def mech_status(self):
+        """Live MechStatus, or the one persisted before the last restart."""
+        if self.client.mech_status is not None:
+            return self.client.mech_status
+        return self.store.mech_status
+
+    @property
+    def mech_settings(self):
+        """Live MechSettings, or the one persisted before the last restart."""
+        if self.client.mech_settings is not None:
+            return self.client.mech_settings
+        return self.store.mech_settings
+
+    @property
+    def available(self) -> bool:
+        return self.client.is_connected or self._restored or self._migrating \
+            or ((self.passive or self._idle) and self._present)
+
+    def add_availability_listener(self, callback: Callable[[], None]) -> CALLBACK_TYPE:
+        self._availability_listeners.append(callback)
+        def remove() -> None:
+            self._availability_listeners.remove(callback)
+        return remove
+
+    def _notify_availability(self) -> None:
+        for callback in list(self._availability_listeners):
+            callback()
+
+    def _drop_restored(self) -> None:
+        if self._restored:
+            self._restored = False
+            self._notify_availability()
+
+    def _async_device_found(self, advertisement: SesameAdvertisement) -> None:
+        if not self.passive and not advertisement.connectable:
+            return
+        self.rssi = advertisement.rssi
+        self._update_routing(advertisement.source)
+        if not self._present:
+            self._present = True
+            self._notify_availability()
+        if advertisement.rssi < self.prewarm_rssi - PREWARM_HYSTERESIS:
+            self._prewarm_armed = True
+        if self.passive:
+            self._on_passive_advertisement(advertisement)
+        elif not self._idle:
+            self.connection.request_connect()
+        else:
+            # Until the next connection an idle-disconnected lock is only heard through its advertisements
+            self._on_passive_advertisement(advertisement)
+            if self._prewarm_armed and advertisement.rssi >= self.prewarm_rssi:
+                # Only pre-warmed when it comes within range, not while it stays there
+                self._prewarm_armed = False
+                self.connection.request_connect()
+
+    def _update_routing(self, fallback_source: str) -> None:
+        """Route the next connection through the best source and migrate away from a degraded one."""
+        now = time.monotonic()
+        if now - self._last_routing < ROUTING_INTERVAL:
+            return
+        self._last_routing = now
+        self.sources.refresh(self.hass, self.entry.data[CONF_MAC])
+        best = self.sources.best() or fallback_source
+        self.connection.source = best
+        if not self.client.is_connected or self._sessions or self.connected_source in (None, best) \
+                or now - self._last_migration < MIGRATION_COOLDOWN:
+            return
+        current_rssi = self.sources.rssi(self.connected_source)
+        best_rssi = self.sources.rssi(best)
+        if best_rssi is not None and (current_rssi is None or best_rssi - current_rssi >= MIGRATION_MARGIN):
+            _LOGGER.debug(
+                "Migrating %s from %s (%s dBm) to %s (%s dBm)",
+                self.entry.title, self.connected_source, current_rssi, best, best_rssi,
+            )
+            self._last_migration = now
+            self._migrating = True
+            self.entry.async_create_background_task(
+                self.hass, self._async_migrate(), f"{DOMAIN} migrate {self.entry.title}"
+            )
+
+    async def _async_migrate(self) -> None:
+        """Reconnect through the best source; entities stay available while the link is re-established."""
+        try:
+            await self.client.disconnect()
+            await self.connection.connect()
+        except Exception as e:
+            _LOGGER.warning("Migrating %s to %s failed, reconnecting: %s", self.entry.title, self.connection.source, e)
+            self.connection.request_connect()
+        finally:
+            self._migrating = False
+            self._notify_availability()
+
+    def _on_passive_advertisement(self, advertisement: SesameAdvertisement) -> None:
+        if self.client.is_connected:
+            return
+        # Advertisements only carry flags; keep everything else from the last known status
+        last = self.status_dispatcher.last
+        status = SimpleNamespace(**{field: getattr(last, field, None) for field in MECH_STATUS_FIELDS})
+        status.lock_range = advertisement.locked
+        # Between the two ranges neither flag is set, which advertisements cannot tell apart from unlocked
+        if advertisement.locked:
+            status.unlock_range = False
+        elif last is None or last.lock_range:
+            status.unlock_range = None
+        status.critical = advertisement.critical
+        status.stop = True
+        self._advertised_status = status
+        self.status_dispatcher.publish(status)
+
+    def is_advertised(self, status) -> bool:
+        """Whether `status` was synthesized from an advertisement rather than reported by the client."""
+        return status is self._advertised_status
+
+    def _async_device_unavailable(self, _service_info) -> None:
+        if self._present:
+            self._present = False
+            self._notify_availability()
+
+    @asynccontextmanager
+    async def connected(self):
+        """Connect on demand for a user-initiated command.
+
+        With an idle timeout the connection is dropped again once no command
+        has used it for that long. The time spent is recorded in
+        command_latency, split by whether the connection was already warm.
+        """
+        started = time.monotonic()
+        warm = self.client.is_connected
+        self._sessions += 1
+        self._cancel_idle_disconnect()
+        try:
+            await self.connection.connect(ConnectionScheduler.PRIORITY_USER)
+            yield
+            elapsed = time.monotonic() - started
+            self.command_latency["warm" if warm else "cold"].add(elapsed)
+            _LOGGER.debug("Command on %s took %.2fs (%s)", self.entry.title, elapsed, "warm" if warm else "cold")
+        finally:
+            self._sessions -= 1
+            self._arm_idle_disconnect()
+
+    async def async_prewarm(self) -> None:
+        """Connect and authenticate ahead of an expected command."""
+        self._cancel_idle_disconnect()
+        await self.connection.connect(ConnectionScheduler.PRIORITY_USER)
+        self._arm_idle_disconnect()
+
+    def _cancel_idle_disconnect(self) -> None:
+        if self._idle_disconnect is not None:
+            self._idle_disconnect()
+            self._idle_disconnect = None
+
+    def _arm_idle_disconnect(self) -> None:
+        self._cancel_idle_disconnect()
+        if self.idle_timeout and self._sessions == 0:
+            self._idle_disconnect = async_call_later(
+                self.hass, self.idle_timeout, self._async_idle_disconnect
+            )
+
+    async def _async_idle_disconnect(self, _now) -> None:
+        self._idle_disconnect = None
+        if self._sessions == 0 and self.client.is_connected:
+            self._idle = True
+            await self.client.disconnect()
 
     async def initialize(self):
-        if bluetooth.async_address_present(self.hass, self.entry.data[CONF_MAC], connectable=True):
-            if not self.client.is_connected:
-                await self.client.connect()
-            if self.client.mech_status is None:
-                try:
-                    await self.client.wait_for(Event.MechStatusEvent)
-                except TimeoutError:
-                    pass
-            await self.populate_device_info()
+        """Start the device without blocking config entry setup.
+
+        Connecting, waiting for the first status and populating device info
+        run in the background; entities stay unavailable until then.
+        """
+        await self.store.async_load()
+        if (restored := self.store.mech_status) is not None:
+            # Show the last known state while the first connection is made
+            self._restored = True
+            self.status_dispatcher.publish(restored)
+        if (restored := self.store.mech_settings) is not None:
+            self.settings_dispatcher.publish(restored)
+        if (sw_version := self.store.sw_version) is not None:
+            self.device_info["sw_version"] = sw_version
+        self.status_dispatcher.start()
+        self.settings_dispatcher.start()
+        self.entry.async_on_unload(self.status_dispatcher.subscribe(self._on_mech_status))
+        self.entry.async_on_unload(self.settings_dispatcher.subscribe(self._on_mech_settings))
+        self.entry.async_on_unload(self.commands.start())
+        self.entry.async_on_unload(self.watchdog.start())
+        self.client.on_connected(self._on_connected)
+        self.client.on_disconnected(self._on_disconnected)
         self.entry.async_on_unload(
-           bluetooth.async_register_callback(
-                self.hass,
-                self._async_device_found,
-                {"address": self.entry.data[CONF_MAC]},
-                bluetooth.BluetoothScanningMode.ACTIVE,
+            async_get_discovery_index(self.hass).async_register_device(self.entry.data[CONF_MAC], self._async_device_found)
+        )
+        self.entry.async_on_unload(
+            bluetooth.async_track_unavailable(
+                self.hass, self._async_device_unavailable, self.entry.data[CONF_MAC], connectable=False
             )
         )
+        self.entry.async_create_background_task(
+            self.hass, self._async_start(), f"{DOMAIN} start {self.entry.title}"
+        )
+
+    async def _async_start(self) -> None:
+        started = time.monotonic()
+        if self.passive:
+            # The last advertisement was already delivered when registering with the discovery index
+            self._drop_restored()
+            return
+        if (service_info := bluetooth.async_last_service_info(self.hass, self.entry.data[CONF_MAC], connectable=True)) is not None:
+            self._update_routing(service_info.source)
+        if not self.client.is_connected and not bluetooth.async_address_present(self.hass, self.entry.data[CONF_MAC], connectable=True):
+            _LOGGER.debug("%s not present at startup, waiting for advertisements", self.entry.title)
+            self._drop_restored()
+            return
+        self._present = True
+        try:
+            await self.connection.connect()
+        except Exception as e:
+            _LOGGER.debug("Initial connection to %s failed: %s", self.entry.title, e)
+            self._drop_restored()
+            return
+        self.startup_timings["connect"] = time.monotonic() - started
+        if self.client.mech_status is None:
+            try:
+                await self.client.wait_for(Event.MechStatusEvent)
+            except TimeoutError:
+                pass
+        self.startup_timings["first_status"] = time.monotonic() - started
+        self._on_connected()
+        if self._device_info_task is not None:
+            await asyncio.shield(self._device_info_task)
+        self.startup_timings["device_info"] = time.monotonic() - started
+        _LOGGER.debug(
+            "Startup of %s would have blocked setup for %.2fs (connect %.2fs, first status %.2fs)",
+            self.entry.title,
+            self.startup_timings["device_info"],
+            self.startup_timings["connect"],
+            self.startup_timings["first_status"],
+        )
+
+    def _on_mech_status(self, status) -> None:
+        if self.is_advertised(status):
+            return
+        previous, self._last_reported = self._last_reported, status
+        if not status.stop:
+            return
+        self.store.update_mech_status(status)
+        # History can only have changed once the motor came to rest; the first frame only repeats the last entry
+        if self.client.is_connected and previous is not None \
+                and (not previous.stop or previous.lock_range != status.lock_range):
+            self.invalidate_history()
+            self.entry.async_create_background_task(
+                self.hass, self._async_report_history(), f"{DOMAIN} history {self.entry.title}"
+            )
+
+    def reached(self, status, kind: str) -> bool:
+        """Whether a status frame of a still moving motor already completes a `kind` ("lock"/"unlock") command."""
+        return False
+
+    def _on_mech_settings(self, settings) -> None:
+        self.store.update_mech_settings(settings)
+
+    def _on_disconnected(self) -> None:
+        self.connected_source = None
+        self._restored = False
+        self._notify_availability()
 
-    async def _on_found(self):
-        if not self.client.is_connected:
-            await asyncio.sleep(2)
-            await self.client.connect()
-        if self.device_info is None:
+    def _on_connected(self) -> None:
+        # Home Assistant picks the adapter itself; it is only known for sure when a single one hears the lock
+        self.connected_source = self.sources.sole()
+        self._restored = False
+        self._idle = False
+        self.watchdog.on_connected()
+        self._notify_availability()
+        self._arm_idle_disconnect()
+        if self.store.sw_version_stale() and self._device_info_task is None:
+            self._device_info_task = self.entry.async_create_background_task(
+                self.hass, self._async_populate_device_info(), f"{DOMAIN} device info {self.entry.title}"
+            )
+
+    async def _async_populate_device_info(self) -> None:
+        try:
             await self.populate_device_info()
+        except Exception as e:
+            _LOGGER.debug("Failed to read device info of %s: %s", self.entry.title, e)
+        finally:
+            self._device_info_task = None
+
+    def start_trace(self, path: Optional[str] = None) -> str:
+        """Record client events to `path`, by default a per-device file in the config directory."""
+        if self.trace is not None:
+            return self.trace.path
+        path = path or self.hass.config.path(DOMAIN, "traces", f"{format_mac(self.entry.data[CONF_MAC]).replace(':', '')}.jsonl")
+        self.trace = TraceRecorder(self.hass, self.client, path)
+        self.trace.start()
+        return path
+
+    async def async_stop_trace(self) -> None:
+        if (trace := self.trace) is not None:
+            self.trace = None
+            await trace.async_stop()
 
     async def disconnect(self):
+        await self.async_stop_trace()
+        self.commands.stop()
+        self._cancel_idle_disconnect()
+        self.connection.cancel()
+        self.status_dispatcher.stop()
+        self.settings_dispatcher.stop()
         await self.client.disconnect()
 
+    def invalidate_history(self) -> None:
+        """Mark the cached history tail stale, e.g. once the motor settled."""
+        self._history_generation += 1
+
+    async def get_history_tail(self):
+        """Return the history tail, sharing in-flight queries and reusing the result until invalidated."""
+        generation = self._history_generation
+        if self._history_cache is not None and self._history_cache[0] == generation:
+            return self._history_cache[1]
+        if self._history_inflight is None or self._history_inflight[0] != generation:
+            task = self.hass.async_create_task(self._fetch_history_tail(generation))
+            self._history_inflight = (generation, task)
+            # The task may already have finished eagerly; the callback still runs afterwards
+            task.add_done_callback(self._on_history_fetched)
+        return await asyncio.shield(self._history_inflight[1])
+
+    def _on_history_fetched(self, task: asyncio.Task) -> None:
+        if self._history_inflight is not None and self._history_inflight[1] is task:
+            self._history_inflight = None
+
+    async def _fetch_history_tail(self, generation: int):
+        started = time.monotonic()
+        result = await self.client.get_history_tail()
+        self.history_latency.add(time.monotonic() - started)
+        if self._history_cache is None or self._history_cache[0] <= generation:
+            self._history_cache = (generation, result)
+        return result
+
+    async def _async_report_history(self) -> None:
+        """Fire EVENT_HISTORY with the entry the lock recorded for the movement that just settled."""
+        try:
+            result = await self.get_history_tail()
+        except Exception as e:
+            _LOGGER.debug("Reading the history of %s failed: %s", self.entry.title, e)
+            return
+        if result.response is None:
+            return
+        self.hass.bus.async_fire(EVENT_HISTORY, {
+            "name": self.entry.title,
+            "type": result.response.type.name,
+            "entity_id": entity_registry.async_get(self.hass).async_get_entity_id(
+                Platform.LOCK, DOMAIN, format_mac(self.entry.data[CONF_MAC])
+            ),
+        })
+
     async def populate_device_info(self) -> None:
         self.device_info["sw_version"] = await self.client.get_version()
+        self.store.update_sw_version(self.device_info["sw_version"])
         device_registry.async_get(self.hass).async_get_or_create(
             config_entry_id=self.entry.entry_id,
             identifiers=self.device_info.get("identifiers"),
             sw_version=self.device_info.get("sw_version"),
+            model=self.device_info.get("model"),
         )
     @abstractmethod
+    def entity_factories(self, entity_type: Platform) -> list[tuple[str, Callable[[], Entity]]]:
+        """Return (unique_id suffix, constructor) pairs of the entities offered on a platform."""
+        raise NotImplementedError("Subclasses must implement entity_factories method")
+
+    def build_entities(self) -> None:
+        """Construct the entities that are not disabled in the entity registry.
+
+        Entities missing from the registry are always built so they get
+        registered, disabled by default or not; the entry is reloaded when
+        one of them is enabled later. Only platforms with anything to set up
+        are listed in `platforms` for forwarding.
+        """
+        registry = entity_registry.async_get(self.hass)
+        mac = format_mac(self.entry.data[CONF_MAC])
+        for platform in self.offers:
+            entities = []
+            for suffix, factory in self.entity_factories(platform):
+                unique_id = f"{mac}_{suffix}" if suffix else mac
+                if (entity_id := registry.async_get_entity_id(platform, DOMAIN, unique_id)) is not None \
+                        and registry.entities[entity_id].disabled:
+                    continue
+                entities.append(factory())
+            if entities:
+                self._entities[platform] = entities
+        self.platforms = list(self._entities)
+
     def get_entities(self, entity_type: Platform):
-        raise NotImplementedError("Subclasses must implement get_entities method")
+        return self._entities.get(entity_type, [])
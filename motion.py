@@ -0,0 +1,47 @@
+"""Motor motion estimation from MechStatus frames."""
+
+from collections import deque
+import time
+from typing import Optional
+
+from .const import MOTION_WINDOW
+
+
+class MotionEstimator:
+    """Tracks the angular velocity of a moving motor over the last few frames.
+
+    Samples are dropped when the motor stops or heads for a new target, so
+    the velocity only ever describes the current movement.
+    """
+
+    def __init__(self, window: int = MOTION_WINDOW) -> None:
+        self._samples: deque[tuple[float, float, float]] = deque(maxlen=window)
+
+    def update(self, status, now: Optional[float] = None) -> None:
+        if status.stop:
+            self._samples.clear()
+            return
+        if self._samples and self._samples[-1][2] != status.target:
+            self._samples.clear()
+        self._samples.append((time.monotonic() if now is None else now, status.position, status.target))
+
+    @property
+    def velocity(self) -> Optional[float]:
+        """Angular velocity in degrees per second, None until two frames of a movement were seen."""
+        if len(self._samples) < 2:
+            return None
+        (first_time, first_position, _), (last_time, last_position, _) = self._samples[0], self._samples[-1]
+        if last_time <= first_time:
+            return None
+        return (last_position - first_position) / (last_time - first_time)
+
+    def remaining(self, now: Optional[float] = None) -> Optional[float]:
+        """Seconds until the motor reaches its target, None if it is not approaching it."""
+        if (velocity := self.velocity) is None:
+            return None
+        last_time, position, target = self._samples[-1]
+        distance = target - position
+        if velocity == 0 or distance * velocity < 0:
+            return None
+        elapsed = (time.monotonic() if now is None else now) - last_time
+        return max(distance / velocity - elapsed, 0.0)
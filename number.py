@@ -4,7 +4,7 @@ from .models import SesameConfigEntry
 
 
 async def async_setup_entry(hass, entry: SesameConfigEntry, async_add_entities):
-    if Platform.NUMBER in entry.runtime_data.offers:
+    if Platform.NUMBER in entry.runtime_data.platforms:
         async_add_entities(
             entry.runtime_data.get_entities(Platform.NUMBER),
         )
\ No newline at end of file
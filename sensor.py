@@ -1,10 +1,15 @@
+from datetime import timedelta
+
 from homeassistant.const import Platform
 
 from .models import SesameConfigEntry
 
+# Only the link metric sensors poll
+SCAN_INTERVAL = timedelta(seconds=60)
+
 
 async def async_setup_entry(hass, entry: SesameConfigEntry, async_add_entities):
-    if Platform.SENSOR in entry.runtime_data.offers:
+    if Platform.SENSOR in entry.runtime_data.platforms:
         async_add_entities(
             entry.runtime_data.get_entities(Platform.SENSOR),
         )
\ No newline at end of file
@@ -0,0 +1,121 @@
+"""Domain services of the SesameOS 3 integration."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+import logging
+import time
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components.lock import DOMAIN as LOCK_DOMAIN
+from homeassistant.const import ATTR_ENTITY_ID, ENTITY_MATCH_ALL
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv, service
+
+from .const import BULK_RETRIES, BULK_RETRY_DELAY, DOMAIN, MAX_CONNECTS_PER_SOURCE
+from .models import CommandSuperseded
+
+_LOGGER = logging.getLogger(__name__)
+
+BULK_SCHEMA = cv.make_entity_service_schema({})
+
+
+def _resolve_locks(hass: HomeAssistant, call: ServiceCall):
+    """Map the targeted Sesame lock entities to their devices, ignoring other targeted entities."""
+    locks = {
+        entry.runtime_data.lock.entity_id: entry.runtime_data
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if getattr(entry, "runtime_data", None) is not None and entry.runtime_data.lock is not None
+        and entry.runtime_data.lock.entity_id is not None
+    }
+    if call.data.get(ATTR_ENTITY_ID) != ENTITY_MATCH_ALL:
+        targeted = service.async_extract_entity_ids(hass, call)
+        locks = {entity_id: device for entity_id, device in locks.items() if entity_id in targeted}
+    if not locks:
+        raise ServiceValidationError("No Sesame lock targeted")
+    return locks
+
+
+async def _async_run_bulk(hass: HomeAssistant, call: ServiceCall, action: str) -> ServiceResponse:
+    """Run `action` on every target lock, bounded per adapter and retrying transient failures."""
+    devices = _resolve_locks(hass, call)
+    limits: defaultdict[Any, asyncio.Semaphore] = defaultdict(lambda: asyncio.Semaphore(MAX_CONNECTS_PER_SOURCE))
+    started = time.monotonic()
+
+    async def run(entity_id: str, device) -> dict[str, Any]:
+        lock_started = time.monotonic()
+        error = None
+        async with limits[device.connection.source]:
+            for attempt in range(1, BULK_RETRIES + 2):
+                try:
+                    await getattr(device.lock, f"async_{action}")()
+                except CommandSuperseded as e:
+                    # Retrying would undo the command that replaced it
+                    error = str(e)
+                    break
+                except Exception as e:
+                    error = str(e) or type(e).__name__
+                    _LOGGER.debug("%s of %s failed (attempt %d): %s", action, entity_id, attempt, error)
+                    if attempt <= BULK_RETRIES:
+                        await asyncio.sleep(BULK_RETRY_DELAY * attempt)
+                else:
+                    error = None
+                    break
+        return {
+            "success": error is None,
+            "attempts": attempt,
+            "duration": round(time.monotonic() - lock_started, 3),
+            "error": error,
+        }
+
+    results = await asyncio.gather(*(run(entity_id, device) for entity_id, device in devices.items()))
+    return {
+        "duration": round(time.monotonic() - started, 3),
+        "succeeded": sum(1 for result in results if result["success"]),
+        "failed": sum(1 for result in results if not result["success"]),
+        "results": dict(zip(devices, results)),
+    }
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    async def async_lock_all(call: ServiceCall) -> ServiceResponse:
+        return await _async_run_bulk(hass, call, "lock")
+
+    async def async_unlock_all(call: ServiceCall) -> ServiceResponse:
+        return await _async_run_bulk(hass, call, "unlock")
+
+    hass.services.async_register(
+        DOMAIN, "lock_all", async_lock_all, schema=BULK_SCHEMA, supports_response=SupportsResponse.OPTIONAL
+    )
+    hass.services.async_register(
+        DOMAIN, "unlock_all", async_unlock_all, schema=BULK_SCHEMA, supports_response=SupportsResponse.OPTIONAL
+    )
+
+    for name, schema, method, supports_response in (
+        ("prewarm", {}, "async_prewarm", SupportsResponse.NONE),
+        ("apply_settings", {
+            vol.Optional("lock"): vol.All(vol.Coerce(int), vol.Range(min=-32768, max=32767)),
+            vol.Optional("unlock"): vol.All(vol.Coerce(int), vol.Range(min=-32768, max=32767)),
+            vol.Optional("auto_lock_seconds"): vol.All(vol.Coerce(int), vol.Range(min=0, max=65535)),
+        }, "async_apply_settings", SupportsResponse.NONE),
+        ("start_trace", {vol.Optional("path"): cv.string}, "async_start_trace", SupportsResponse.NONE),
+        ("stop_trace", {}, "async_stop_trace", SupportsResponse.NONE),
+        ("replay_trace", {
+            vol.Required("path"): cv.string,
+            vol.Optional("speed", default=1.0): vol.All(vol.Coerce(float), vol.Range(min=0)),
+        }, "async_replay_trace", SupportsResponse.OPTIONAL),
+        ("get_history_tail", {}, "async_get_history_tail", SupportsResponse.ONLY),
+    ):
+        service.async_register_platform_entity_service(
+            hass,
+            DOMAIN,
+            name,
+            entity_domain=LOCK_DOMAIN,
+            schema=schema,
+            func=method,
+            supports_response=supports_response,
+        )
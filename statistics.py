@@ -0,0 +1,120 @@
+"""Hourly long-term statistics of MechStatus values."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional
+
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import format_mac
+from homeassistant.helpers.event import async_track_utc_time_change
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .storage import SesameStore
+
+
+@dataclass
+class _Bucket:
+    start: datetime
+    min: float
+    max: float
+    total: float
+    count: int = 1
+
+
+class HourlyStatistics:
+    """Aggregates MechStatus fields into hourly min/mean/max and publishes them as external statistics.
+
+    The mean is taken over the frames received within the hour. An hour is
+    published once it is over; the unfinished one is kept in the store so a
+    reload or restart continues it instead of publishing it twice.
+    """
+
+    def __init__(self, hass: HomeAssistant, store: SesameStore, mac: str, name: str, units: dict[str, str]) -> None:
+        self.hass = hass
+        self._store = store
+        self._unsub: Optional[Callable[[], None]] = None
+        self._name = name
+        self._units = units
+        self._statistic_ids = {field: f"{DOMAIN}:{format_mac(mac).replace(':', '')}_{field}" for field in units}
+        self._buckets: dict[str, _Bucket] = {}
+
+    def start(self) -> Callable[[], None]:
+        """Resume the stored hour and publish finished hours shortly after each hour; the returned callable stops."""
+        for field, stored in self._store.statistics.items():
+            if field in self._units:
+                self._buckets[field] = _Bucket(**{**stored, "start": dt_util.utc_from_timestamp(stored["start"])})
+        # Hours that ended while unloaded are complete as far as we will ever know
+        self._async_hour_passed(dt_util.utcnow())
+        self._unsub = async_track_utc_time_change(self.hass, self._async_hour_passed, minute=0, second=5)
+
+        @callback
+        def stop() -> None:
+            if self._unsub is not None:
+                self._unsub()
+                self._unsub = None
+        return stop
+
+    def add(self, status) -> None:
+        if self._unsub is None:
+            return
+        hour = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+        created = False
+        for field in self._units:
+            if (value := getattr(status, field)) is None:
+                continue
+            bucket = self._buckets.get(field)
+            if bucket is not None and bucket.start != hour:
+                self._publish(lambda finished: finished is bucket)
+                bucket = None
+            if bucket is None:
+                self._buckets[field] = _Bucket(hour, value, value, value)
+                created = True
+            else:
+                bucket.min = min(bucket.min, value)
+                bucket.max = max(bucket.max, value)
+                bucket.total += value
+                bucket.count += 1
+        # Frames of a moving motor only add to the buckets; the settled frame saves them
+        if created or status.stop:
+            self._save()
+
+    @callback
+    def _async_hour_passed(self, now: datetime) -> None:
+        hour = now.replace(minute=0, second=0, microsecond=0)
+        self._publish(lambda bucket: bucket.start < hour)
+
+    def _save(self) -> None:
+        self._store.update_statistics({
+            field: {**asdict(bucket), "start": bucket.start.timestamp()} for field, bucket in self._buckets.items()
+        })
+
+    def _publish(self, finished: Callable[[_Bucket], bool]) -> None:
+        for field, bucket in list(self._buckets.items()):
+            if not finished(bucket):
+                continue
+            del self._buckets[field]
+            self._save()
+            if "recorder" not in self.hass.config.components:
+                continue
+            metadata = StatisticMetaData(
+                has_mean=True,
+                has_sum=False,
+                name=f"{self._name} {field}",
+                source=DOMAIN,
+                statistic_id=self._statistic_ids[field],
+                unit_of_measurement=self._units[field],
+            )
+            async_add_external_statistics(self.hass, metadata, [StatisticData(
+                start=bucket.start,
+                min=bucket.min,
+                max=bucket.max,
+                mean=bucket.total / bucket.count,
+            )])
@@ -0,0 +1,86 @@
+"""Persisted last-known state of a Sesame device."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any, Optional
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 10
+# Firmware only changes on update, re-read it once a week at most
+SW_VERSION_MAX_AGE = 7 * 24 * 3600
+
+MECH_STATUS_FIELDS = (
+    "battery", "target", "position", "clutch_failed", "lock_range",
+    "unlock_range", "critical", "stop", "low_battery", "clockwise",
+)
+MECH_SETTINGS_FIELDS = ("lock", "unlock", "auto_lock_seconds")
+
+
+class SesameStore:
+    """Keeps the last MechStatus, MechSettings, firmware version and open statistics hour of an entry across restarts."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, persist: bool = True) -> None:
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
+        self._data: dict[str, Any] = {}
+        # A store that does not persist only keeps its updates in memory
+        self._persist = persist
+
+    async def async_load(self) -> None:
+        self._data = await self._store.async_load() or {}
+
+    async def async_remove(self) -> None:
+        await self._store.async_remove()
+
+    def _restore(self, key: str) -> Optional[SimpleNamespace]:
+        if (stored := self._data.get(key)) is None:
+            return None
+        return SimpleNamespace(**stored["value"])
+
+    @property
+    def mech_status(self) -> Optional[SimpleNamespace]:
+        return self._restore("mech_status")
+
+    @property
+    def mech_settings(self) -> Optional[SimpleNamespace]:
+        return self._restore("mech_settings")
+
+    @property
+    def sw_version(self) -> Optional[str]:
+        if (stored := self._data.get("sw_version")) is None:
+            return None
+        return stored["value"]
+
+    @property
+    def statistics(self) -> dict[str, dict[str, Any]]:
+        if (stored := self._data.get("statistics")) is None:
+            return {}
+        return stored["value"]
+
+    def sw_version_stale(self) -> bool:
+        if (stored := self._data.get("sw_version")) is None:
+            return True
+        return dt_util.utcnow().timestamp() - stored["updated"] > SW_VERSION_MAX_AGE
+
+    def update_mech_status(self, status) -> None:
+        self._update("mech_status", {field: getattr(status, field) for field in MECH_STATUS_FIELDS})
+
+    def update_mech_settings(self, settings) -> None:
+        self._update("mech_settings", {field: getattr(settings, field) for field in MECH_SETTINGS_FIELDS})
+
+    def update_sw_version(self, version: str) -> None:
+        self._update("sw_version", version)
+
+    def update_statistics(self, buckets: dict[str, dict[str, Any]]) -> None:
+        self._update("statistics", buckets)
+
+    def _update(self, key: str, value: Any) -> None:
+        self._data[key] = {"value": value, "updated": dt_util.utcnow().timestamp()}
+        if self._persist:
+            self._store.async_delay_save(lambda: self._data, SAVE_DELAY)
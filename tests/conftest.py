@@ -0,0 +1,115 @@
+"""Fixtures for running the integration inside a Home Assistant test instance.
+
+The repository root is the integration package itself. It is linked into a
+temporary `custom_components` directory so Home Assistant loads it as the
+custom integration `sesameos3`.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+import sys
+import tempfile
+from typing import Any, Optional
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components import bluetooth
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+_CUSTOM_COMPONENTS = Path(tempfile.mkdtemp()) / "custom_components"
+_CUSTOM_COMPONENTS.mkdir()
+(_CUSTOM_COMPONENTS / "__init__.py").touch()
+(_CUSTOM_COMPONENTS / "sesameos3").symlink_to(Path(__file__).resolve().parent.parent, target_is_directory=True)
+sys.path.insert(0, str(_CUSTOM_COMPONENTS.parent))
+
+from custom_components.sesameos3.const import CONF_PASSIVE, DOMAIN  # noqa: E402
+
+from fake_client import FakeSesameClient  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations: None) -> None:
+    """Let Home Assistant load the linked integration."""
+
+
+@pytest.fixture
+def service_infos() -> dict[str, Any]:
+    """Last advertisement heard from each address, as returned by bluetooth.async_last_service_info."""
+    return {}
+
+
+@pytest.fixture(autouse=True)
+def mock_bluetooth(service_infos: dict[str, Any]):
+    """Stand in for the Bluetooth APIs the integration uses; every lock is present."""
+    def last_service_info(hass, address, connectable=True):
+        return service_infos.get(address.upper())
+
+    with (
+        patch.object(bluetooth, "async_register_callback", return_value=lambda: None),
+        patch.object(bluetooth, "async_discovered_service_info", return_value=[]),
+        patch.object(bluetooth, "async_last_service_info", side_effect=last_service_info),
+        patch.object(bluetooth, "async_address_present", return_value=True),
+        patch.object(bluetooth, "async_track_unavailable", return_value=lambda: None),
+        patch.object(bluetooth, "async_scanner_devices_by_address", return_value=[]),
+    ):
+        yield
+
+
+@pytest.fixture
+def clients() -> dict[str, FakeSesameClient]:
+    """The simulated clients created for the set-up locks, by address."""
+    return {}
+
+
+@pytest.fixture
+def setup_locks(
+    hass: HomeAssistant, hass_storage: dict[str, Any], clients: dict[str, FakeSesameClient], unload_locks: None
+) -> Callable[..., Awaitable[list[MockConfigEntry]]]:
+    """Return a helper setting up `count` simulated Sesame 5 entries.
+
+    `stored` is the SesameStore content every entry starts with. Further
+    keyword arguments are passed to every FakeSesameClient.
+    """
+    async def setup(count: int = 1, *, passive: bool = False, block: bool = True,
+                    stored: Optional[dict[str, Any]] = None, **client_options: Any) -> list[MockConfigEntry]:
+        def make_client(address: str, secret: bytes) -> FakeSesameClient:
+            client = clients[address] = FakeSesameClient(address, secret, **client_options)
+            return client
+
+        entries = []
+        for index in range(count):
+            address = f"AA:BB:CC:00:{index // 256:02X}:{index % 256:02X}"
+            entry = MockConfigEntry(
+                domain=DOMAIN,
+                title=f"Sesame {index}",
+                unique_id=address.lower(),
+                data={"mac": address, "device_secret": "AAAAAAAAAAAAAAAAAAAAAA=="},
+                options={CONF_PASSIVE: passive},
+            )
+            entry.add_to_hass(hass)
+            entries.append(entry)
+            if stored is not None:
+                key = f"{DOMAIN}.{entry.entry_id}"
+                hass_storage[key] = {"version": 1, "minor_version": 1, "key": key, "data": stored}
+        with patch("custom_components.sesameos3.models.SesameClient", side_effect=make_client):
+            assert await async_setup_component(hass, DOMAIN, {})
+            if block:
+                await hass.async_block_till_done()
+        return entries
+
+    return setup
+
+
+@pytest.fixture
+async def unload_locks(hass: HomeAssistant):
+    """Unload every entry at the end of the test so no connection outlives it."""
+    yield
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
@@ -0,0 +1,173 @@
+"""Simulated SesameClient emitting scripted MechStatus/MechSettings streams."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+from types import SimpleNamespace
+from typing import Any, Optional
+
+from sesameos3client import Event
+
+LOCK_ANGLE = 90
+UNLOCK_ANGLE = 0
+
+
+def mech_status(position: int, *, stop: bool = True, target: Optional[int] = None, **fields: Any) -> SimpleNamespace:
+    """A MechStatus at `position`, in the lock or unlock range if it is at that angle."""
+    status = SimpleNamespace(
+        battery=6000,
+        target=position if target is None else target,
+        position=position,
+        clutch_failed=False,
+        lock_range=position == LOCK_ANGLE,
+        unlock_range=position == UNLOCK_ANGLE,
+        critical=False,
+        stop=stop,
+        low_battery=False,
+        clockwise=False,
+    )
+    for field, value in fields.items():
+        setattr(status, field, value)
+    return status
+
+
+def mech_settings(lock: int = LOCK_ANGLE, unlock: int = UNLOCK_ANGLE, auto_lock_seconds: int = 0) -> SimpleNamespace:
+    return SimpleNamespace(lock=lock, unlock=unlock, auto_lock_seconds=auto_lock_seconds)
+
+
+def movement(start: int, end: int, steps: int = 10) -> list[SimpleNamespace]:
+    """The frames of the motor turning from `start` to `end`, the last one settled."""
+    frames = [
+        mech_status(start + (end - start) * step // steps, stop=False, target=end, clockwise=end < start)
+        for step in range(1, steps)
+    ]
+    frames.append(mech_status(end, target=end, clockwise=end < start))
+    return frames
+
+
+class FakeSesameClient:
+    """Stands in for SesameClient without any Bluetooth.
+
+    Every request to the lock takes `latency` seconds. Lock and unlock turn
+    the motor in `steps` frames, `frame_interval` seconds apart. Frames can
+    also be pushed directly with `emit` or `play`.
+    """
+
+    def __init__(self, address: str, secret: bytes = b"", *, latency: float = 0.0,
+                 frame_interval: float = 0.0, steps: int = 10,
+                 status: Optional[SimpleNamespace] = None, settings: Optional[SimpleNamespace] = None) -> None:
+        self.address = address
+        self.latency = latency
+        self.frame_interval = frame_interval
+        self.steps = steps
+        self.is_connected = False
+        self.mech_status: Optional[SimpleNamespace] = None
+        self.mech_settings: Optional[SimpleNamespace] = None
+        self.sent: list[str] = []
+        self._initial_status = status or mech_status(UNLOCK_ANGLE)
+        self._initial_settings = settings or mech_settings()
+        self._listeners: defaultdict[Any, list[Callable[[Any, Any], None]]] = defaultdict(list)
+        self._waiters: defaultdict[Any, list[asyncio.Future[Any]]] = defaultdict(list)
+        self._connected_callbacks: list[Callable[[], None]] = []
+        self._disconnected_callbacks: list[Callable[[], None]] = []
+        self._motion: Optional[asyncio.Task] = None
+
+    def add_listener(self, event_type, callback: Callable[[Any, Any], None]) -> None:
+        self._listeners[event_type].append(callback)
+
+    def remove_listener(self, event_type, callback: Callable[[Any, Any], None]) -> None:
+        if callback in self._listeners[event_type]:
+            self._listeners[event_type].remove(callback)
+
+    def on_connected(self, callback: Callable[[], None]) -> None:
+        self._connected_callbacks.append(callback)
+
+    def on_disconnected(self, callback: Callable[[], None]) -> None:
+        self._disconnected_callbacks.append(callback)
+
+    async def connect(self) -> None:
+        await asyncio.sleep(self.latency)
+        self.is_connected = True
+        for callback in list(self._connected_callbacks):
+            callback()
+        # A freshly logged in lock reports its settings and status right away
+        self.emit(Event.MechSettingsEvent, self.mech_settings or self._initial_settings)
+        self.emit(Event.MechStatusEvent, self.mech_status or self._initial_status)
+
+    async def disconnect(self) -> None:
+        if self._motion is not None:
+            self._motion.cancel()
+            self._motion = None
+        if not self.is_connected:
+            return
+        self.is_connected = False
+        for callback in list(self._disconnected_callbacks):
+            callback()
+
+    async def wait_for(self, event_type, timeout: float = 10) -> Any:
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._waiters[event_type].append(future)
+        async with asyncio.timeout(timeout):
+            return await future
+
+    async def get_version(self) -> str:
+        await self._request("get_version")
+        return "fake-1.0"
+
+    async def get_history_tail(self) -> SimpleNamespace:
+        await self._request("get_history_tail")
+        return SimpleNamespace(response=None)
+
+    async def lock(self, name: str) -> None:
+        await self._request("lock")
+        self._turn_to(self._settings().lock)
+
+    async def unlock(self, name: str) -> None:
+        await self._request("unlock")
+        self._turn_to(self._settings().unlock)
+
+    async def set_mech_settings(self, lock: int, unlock: int) -> None:
+        await self._request("set_mech_settings")
+        settings = self._settings()
+        self.emit(Event.MechSettingsEvent, mech_settings(lock, unlock, settings.auto_lock_seconds))
+
+    async def set_autolock_time(self, seconds: int) -> None:
+        await self._request("set_autolock_time")
+        settings = self._settings()
+        self.emit(Event.MechSettingsEvent, mech_settings(settings.lock, settings.unlock, seconds))
+
+    def emit(self, event_type, payload: SimpleNamespace, metadata: Any = None) -> None:
+        """Deliver a frame to the listeners the way the real client does."""
+        if event_type is Event.MechStatusEvent:
+            self.mech_status = payload
+        else:
+            self.mech_settings = payload
+        event = SimpleNamespace(response=payload)
+        for callback in list(self._listeners[event_type]):
+            callback(event, metadata)
+        for future in self._waiters.pop(event_type, []):
+            if not future.done():
+                future.set_result(event)
+
+    async def play(self, frames: Iterable[SimpleNamespace], interval: Optional[float] = None) -> None:
+        """Emit status frames one event-loop iteration (or `interval` seconds) apart."""
+        for frame in frames:
+            await asyncio.sleep(self.frame_interval if interval is None else interval)
+            self.emit(Event.MechStatusEvent, frame)
+
+    async def _request(self, name: str) -> None:
+        if not self.is_connected:
+            raise ConnectionError(f"{self.address} is not connected")
+        self.sent.append(name)
+        await asyncio.sleep(self.latency)
+
+    def _settings(self) -> SimpleNamespace:
+        return self.mech_settings or self._initial_settings
+
+    def _turn_to(self, angle: int) -> None:
+        if self._motion is not None:
+            self._motion.cancel()
+        start = (self.mech_status or self._initial_status).position
+        self._motion = asyncio.get_running_loop().create_task(self.play(movement(start, angle, self.steps)))
@@ -0,0 +1,124 @@
+"""Benchmarks of Sesame5 and its entities driven by simulated clients.
+
+Run with `pytest tests --benchmark-only` to get the timing table. Figures
+measured across awaits (startup, command latency, state writes) cannot go
+through the synchronous benchmark fixture; they are reported as test
+properties, e.g. with `--junitxml`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+import time
+from unittest.mock import patch
+
+import pytest
+from sesameos3client import Event
+
+from homeassistant.components.lock import DOMAIN as LOCK_DOMAIN, SERVICE_LOCK, LockState
+from homeassistant.const import ATTR_ENTITY_ID, EVENT_STATE_CHANGED
+from homeassistant.core import Event as HassEvent, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import Entity
+
+from custom_components.sesameos3.const import DOMAIN
+
+from fake_client import LOCK_ANGLE, UNLOCK_ANGLE, mech_status, movement
+
+LOCK_COUNTS = [1, 10, 50]
+
+
+def lock_entity_ids(hass: HomeAssistant, entries) -> list[str]:
+    registry = er.async_get(hass)
+    return [registry.async_get_entity_id(LOCK_DOMAIN, DOMAIN, entry.unique_id) for entry in entries]
+
+
+@pytest.mark.parametrize("count", LOCK_COUNTS)
+async def test_time_to_first_state(hass: HomeAssistant, setup_locks, record_property, count: int) -> None:
+    """Time from setting up the entries until every lock shows locked or unlocked."""
+    first_state: dict[str, float] = {}
+    done = asyncio.Event()
+
+    @callback
+    def on_state_changed(event: HassEvent) -> None:
+        entity_id = event.data["entity_id"]
+        if not entity_id.startswith(f"{LOCK_DOMAIN}.") or entity_id in first_state:
+            return
+        if (new_state := event.data["new_state"]) is not None and new_state.state in (LockState.LOCKED, LockState.UNLOCKED):
+            first_state[entity_id] = time.perf_counter() - started
+            if len(first_state) == count:
+                done.set()
+
+    unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, on_state_changed)
+    started = time.perf_counter()
+    await setup_locks(count, block=False, latency=0.02)
+    setup_time = time.perf_counter() - started
+    async with asyncio.timeout(30):
+        await done.wait()
+    unsub()
+
+    times = sorted(first_state.values())
+    record_property("setup_time", round(setup_time, 4))
+    record_property("first_state_min", round(times[0], 4))
+    record_property("first_state_max", round(times[-1], 4))
+
+
+@pytest.mark.parametrize("count", LOCK_COUNTS)
+async def test_lock_latency(hass: HomeAssistant, setup_locks, record_property, count: int) -> None:
+    """Latency of a lock command sent to every lock at once, from the service call to the settled frame."""
+    entries = await setup_locks(count, latency=0.02, frame_interval=0.005)
+    entity_ids = lock_entity_ids(hass, entries)
+
+    started = time.perf_counter()
+    await hass.services.async_call(LOCK_DOMAIN, SERVICE_LOCK, {ATTR_ENTITY_ID: entity_ids}, blocking=True)
+    elapsed = time.perf_counter() - started
+    await hass.async_block_till_done()
+
+    latencies = sorted(entry.runtime_data.commands.latency["lock"].last for entry in entries)
+    record_property("total", round(elapsed, 4))
+    record_property("p50", round(latencies[len(latencies) // 2], 4))
+    record_property("max", round(latencies[-1], 4))
+    assert all(hass.states.get(entity_id).state == LockState.LOCKED for entity_id in entity_ids)
+
+
+@pytest.mark.parametrize("count", LOCK_COUNTS)
+async def test_state_writes_per_movement(hass: HomeAssistant, setup_locks, clients, record_property, count: int) -> None:
+    """State writes caused by one full movement of every lock, one frame per event-loop iteration."""
+    await setup_locks(count)
+    frames = movement(UNLOCK_ANGLE, LOCK_ANGLE, steps=20)
+    writes: Counter[str] = Counter()
+    write_ha_state = Entity.async_write_ha_state
+
+    def counting_write(entity: Entity) -> None:
+        writes[entity.entity_id] += 1
+        write_ha_state(entity)
+
+    with patch.object(Entity, "async_write_ha_state", counting_write):
+        await asyncio.gather(*(client.play(frames) for client in clients.values()))
+        await hass.async_block_till_done()
+
+    per_lock = sum(writes.values()) / count
+    record_property("frames", len(frames))
+    record_property("writes_per_lock", per_lock)
+    # Frames are coalesced; nothing is written once per frame
+    assert per_lock < len(frames)
+
+
+@pytest.mark.parametrize("count", LOCK_COUNTS)
+async def test_frame_dispatch(hass: HomeAssistant, setup_locks, clients, benchmark, count: int) -> None:
+    """Event-loop time to dispatch one moving status frame to each lock and its entities."""
+    await setup_locks(count)
+    frames = [mech_status(30, stop=False, target=LOCK_ANGLE), mech_status(60, stop=False, target=LOCK_ANGLE)]
+    emitters = [client.emit for client in clients.values()]
+    toggle = 0
+
+    def dispatch_round() -> None:
+        nonlocal toggle
+        toggle ^= 1
+        for emit in emitters:
+            emit(Event.MechStatusEvent, frames[toggle])
+
+    benchmark.extra_info["locks"] = count
+    benchmark(dispatch_round)
+    await hass.async_block_till_done()
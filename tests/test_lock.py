@@ -0,0 +1,45 @@
+"""Tests of the lock entity's state."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any, Optional
+
+import pytest
+
+from homeassistant.components.lock import DOMAIN as LOCK_DOMAIN, LockState
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.sesameos3.const import ADV_STATUS_LOCKED, ADV_STATUS_REGISTERED, DOMAIN, MANUFACTURER_ID
+from custom_components.sesameos3.storage import MECH_STATUS_FIELDS
+
+from fake_client import UNLOCK_ANGLE, mech_status
+
+ADDRESS = "AA:BB:CC:00:00:00"
+
+
+def advertisement(status: int) -> SimpleNamespace:
+    """The parts of a BluetoothServiceInfoBleak that advertisement parsing reads."""
+    return SimpleNamespace(
+        address=ADDRESS,
+        manufacturer_data={MANUFACTURER_ID: (5).to_bytes(2, "little") + bytes([status]) + bytes(16)},
+        rssi=-50,
+        source="hci0",
+        connectable=False,
+    )
+
+
+@pytest.mark.parametrize("stored_status", [None, mech_status(UNLOCK_ANGLE)])
+async def test_passive_lock_shows_advertisement_heard_before_setup(
+    hass: HomeAssistant, setup_locks, service_infos: dict[str, Any], stored_status: Optional[SimpleNamespace]
+) -> None:
+    """The advertisement delivered while initializing wins over the stored state the entities start from."""
+    service_infos[ADDRESS] = advertisement(ADV_STATUS_REGISTERED | ADV_STATUS_LOCKED)
+    stored = None
+    if stored_status is not None:
+        stored = {"mech_status": {"value": {field: getattr(stored_status, field) for field in MECH_STATUS_FIELDS}, "updated": 0}}
+    entries = await setup_locks(passive=True, stored=stored)
+
+    entity_id = er.async_get(hass).async_get_entity_id(LOCK_DOMAIN, DOMAIN, entries[0].unique_id)
+    assert hass.states.get(entity_id).state == LockState.LOCKED
@@ -0,0 +1,177 @@
+"""Capture and replay of client event traces."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from collections.abc import Callable
+import dataclasses
+from datetime import timedelta
+import json
+import logging
+import os
+import time
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Optional
+
+from sesameos3client import Event, SesameClient
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+from homeassistant.helpers.event import async_track_time_interval
+
+from .metrics import RollingStats
+from .storage import MECH_SETTINGS_FIELDS, MECH_STATUS_FIELDS, SesameStore
+
+if TYPE_CHECKING:
+    from .models import SesameDevice
+
+_LOGGER = logging.getLogger(__name__)
+
+FLUSH_INTERVAL = timedelta(seconds=5)
+
+
+def _payload(value: Any) -> Any:
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if hasattr(value, "__dict__"):
+        return {name: field for name, field in vars(value).items() if not name.startswith("_")}
+    return repr(value)
+
+
+class TraceRecorder:
+    """Appends every event the client delivers to a JSONL file.
+
+    Each line holds the monotonic offset from the start of the capture, the
+    event type, its payload and metadata. Lines are buffered and written from
+    the executor every FLUSH_INTERVAL.
+    """
+    EVENTS = (Event.MechStatusEvent, Event.MechSettingsEvent)
+    # Fields are listed explicitly; EventData may expose them as properties or slots
+    FIELDS = {Event.MechStatusEvent: MECH_STATUS_FIELDS, Event.MechSettingsEvent: MECH_SETTINGS_FIELDS}
+
+    def __init__(self, hass: HomeAssistant, client: SesameClient, path: str) -> None:
+        self.hass = hass
+        self.path = path
+        self._client = client
+        self._buffer: list[str] = []
+        self._started = time.monotonic()
+        self._unsub_flush: Optional[CALLBACK_TYPE] = None
+
+    def start(self) -> None:
+        for event_type in self.EVENTS:
+            self._client.add_listener(event_type, self._on_event)
+        self._unsub_flush = async_track_time_interval(self.hass, self._async_flush, FLUSH_INTERVAL)
+
+    async def async_stop(self) -> None:
+        for event_type in self.EVENTS:
+            self._client.remove_listener(event_type, self._on_event)
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+        await self._async_flush()
+
+    def _on_event(self, event, metadata) -> None:
+        self._buffer.append(json.dumps({
+            "t": round(time.monotonic() - self._started, 4),
+            "type": type(event).__name__,
+            "payload": {field: getattr(event.response, field) for field in self.FIELDS[type(event)]},
+            "metadata": _payload(metadata),
+        }, default=str, separators=(",", ":")))
+
+    async def _async_flush(self, _now=None) -> None:
+        if not self._buffer:
+            return
+        lines, self._buffer = self._buffer, []
+        await self.hass.async_add_executor_job(self._write, lines)
+
+    def _write(self, lines: list[str]) -> None:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as trace:
+            trace.write("\n".join(lines) + "\n")
+
+
+def _read(path: str) -> list[dict[str, Any]]:
+    with open(path, encoding="utf-8") as trace:
+        return [json.loads(line) for line in trace if line.strip()]
+
+
+class ReplayClient:
+    """Stands in for SesameClient on a device fed from a trace; it never connects."""
+
+    is_connected = False
+
+    def __init__(self) -> None:
+        self.mech_status: Optional[SimpleNamespace] = None
+        self.mech_settings: Optional[SimpleNamespace] = None
+        self._listeners: defaultdict[Any, list[Callable[[Any, Any], None]]] = defaultdict(list)
+
+    def add_listener(self, event_type, callback: Callable[[Any, Any], None]) -> None:
+        self._listeners[event_type].append(callback)
+
+    def remove_listener(self, event_type, callback: Callable[[Any, Any], None]) -> None:
+        if callback in self._listeners[event_type]:
+            self._listeners[event_type].remove(callback)
+
+    def on_connected(self, callback) -> None:
+        pass
+
+    def on_disconnected(self, callback) -> None:
+        pass
+
+    async def disconnect(self) -> None:
+        pass
+
+    def emit(self, event_type, payload: SimpleNamespace, metadata: Any = None) -> None:
+        if event_type is Event.MechStatusEvent:
+            self.mech_status = payload
+        else:
+            self.mech_settings = payload
+        for callback in list(self._listeners[event_type]):
+            callback(SimpleNamespace(response=payload), metadata)
+
+
+async def async_replay_trace(device: SesameDevice, path: str, speed: float = 1.0) -> dict[str, Any]:
+    """Feed a recorded trace through an isolated copy of `device` and its entities.
+
+    The copy runs on a ReplayClient and its entities are never added to Home
+    Assistant, so the live lock, its store and statistics are left
+    untouched. `speed` scales the recorded timing; 0 replays as fast as the
+    event loop allows. Returns the number of frames and the time spent
+    dispatching each.
+    """
+    records = await device.hass.async_add_executor_job(_read, path)
+    client = ReplayClient()
+    replica = type(device)(device.hass, device.entry, client)
+    # Its own store would share the live entry's file
+    replica.store = SesameStore(device.hass, device.entry.entry_id, persist=False)
+    replica.status_dispatcher.start()
+    replica.settings_dispatcher.start()
+    for platform in replica.offers:
+        for _, factory in replica.entity_factories(platform):
+            await factory().async_added_to_hass()
+    event_types = {event_type.__name__: event_type for event_type in TraceRecorder.EVENTS}
+    frame_time = RollingStats()
+    replayed = 0
+    previous: Optional[float] = None
+    started = time.monotonic()
+    try:
+        for record in records:
+            if (event_type := event_types.get(record["type"])) is None or not isinstance(record["payload"], dict):
+                continue
+            if speed and previous is not None:
+                await asyncio.sleep((record["t"] - previous) / speed)
+            else:
+                await asyncio.sleep(0)
+            previous = record["t"]
+            frame_started = time.perf_counter()
+            client.emit(event_type, SimpleNamespace(**record["payload"]), record.get("metadata"))
+            frame_time.add(time.perf_counter() - frame_started)
+            replayed += 1
+    finally:
+        replica.status_dispatcher.stop()
+        replica.settings_dispatcher.stop()
+    duration = time.monotonic() - started
+    _LOGGER.debug("Replayed %d frames from %s in %.2fs", replayed, path, duration)
+    return {"frames": replayed, "duration": round(duration, 3), "frame_time": frame_time.as_dict()}
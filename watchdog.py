@@ -0,0 +1,105 @@
+"""Detection of connections that went silent without the client noticing."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+import logging
+import time
+from typing import TYPE_CHECKING, Any, Optional
+
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import DOMAIN, WATCHDOG_PROBE_TIMEOUT
+from .metrics import RollingStats
+
+if TYPE_CHECKING:
+    from .models import SesameDevice
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class LivenessWatchdog:
+    """Probes a connected device whenever no frame arrived for a whole interval.
+
+    Any status or settings frame counts as traffic. A quiet interval is
+    followed by a cheap version read; after `max_misses` failed probes in a
+    row the link is considered dead and the client is forcibly reconnected.
+    `detection_time` measures from the last traffic to that decision and
+    `recovery_time` from the last traffic to the next successful connect.
+    """
+
+    def __init__(self, device: SesameDevice, interval: int, max_misses: int) -> None:
+        self._device = device
+        self._interval = interval
+        self._max_misses = max_misses
+        self.misses = 0
+        self.detection_time = RollingStats()
+        self.recovery_time = RollingStats()
+        self._last_traffic = time.monotonic()
+        self._dead_since: Optional[float] = None
+        self._probe: Optional[asyncio.Task] = None
+
+    def start(self) -> CALLBACK_TYPE:
+        if self._interval <= 0:
+            return lambda: None
+        unsubs = [
+            self._device.status_dispatcher.subscribe(self._on_traffic),
+            self._device.settings_dispatcher.subscribe(self._on_traffic),
+            async_track_time_interval(self._device.hass, self._async_check, timedelta(seconds=self._interval)),
+        ]
+
+        @callback
+        def stop() -> None:
+            for unsub in unsubs:
+                unsub()
+            if self._probe is not None:
+                self._probe.cancel()
+                self._probe = None
+        return stop
+
+    def _on_traffic(self, value: Any) -> None:
+        self._last_traffic = time.monotonic()
+        self.misses = 0
+
+    def on_connected(self) -> None:
+        if self._dead_since is not None:
+            self.recovery_time.add(time.monotonic() - self._dead_since)
+            self._dead_since = None
+        self._last_traffic = time.monotonic()
+        self.misses = 0
+
+    @callback
+    def _async_check(self, now: datetime) -> None:
+        device = self._device
+        if not device.client.is_connected or device.commands.busy or self._probe is not None:
+            return
+        if time.monotonic() - self._last_traffic < self._interval:
+            return
+        self._probe = device.entry.async_create_background_task(
+            device.hass, self._async_probe(), f"{DOMAIN} liveness probe {device.entry.title}"
+        )
+
+    async def _async_probe(self) -> None:
+        device = self._device
+        try:
+            await asyncio.wait_for(device.client.get_version(), WATCHDOG_PROBE_TIMEOUT)
+        except Exception as e:
+            self.misses += 1
+            _LOGGER.debug("Liveness probe %d of %s failed: %s", self.misses, device.entry.title, e)
+        else:
+            self._last_traffic = time.monotonic()
+            self.misses = 0
+        finally:
+            self._probe = None
+        if self.misses < self._max_misses or not device.client.is_connected:
+            return
+        _LOGGER.info("Connection to %s stopped responding, reconnecting", device.entry.title)
+        self._dead_since = self._last_traffic
+        self.detection_time.add(time.monotonic() - self._last_traffic)
+        self.misses = 0
+        try:
+            await device.client.disconnect()
+        finally:
+            device.connection.request_connect()